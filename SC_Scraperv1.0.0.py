@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os
 import re
+import mmap
 import time
 import random
 import asyncio
@@ -9,34 +10,102 @@ import tldextract
 import questionary
 from typing import List, Dict, Optional, Tuple, Set, Any
 from datetime import datetime
-from urllib.parse import quote_plus, urlparse
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver import ChromeOptions
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from fake_useragent import UserAgent
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium_stealth import stealth
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from lxml import etree
+from lxml import html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 import json
+import operator
+import shutil
+import threading
+import concurrent.futures
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.console import Console
 from rich.panel import Panel
 from rich.logging import RichHandler
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 import requests
 import sys
 from dataclasses import dataclass
 import backoff
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
 import logging
 
+try:
+    import ahocorasick  # C-backed multi-pattern matcher (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # C-backed JSON; decodes API payloads without a str detour
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # 64-bit fingerprints for large dedup pools
+    from pyroaring import BitMap64  # compressed integer sets (CRoaring)
+except ImportError:
+    xxhash = BitMap64 = None
+
+try:
+    import redis.asyncio as aioredis  # optional L2 cache, gated by REDIS_URL
+except ImportError:
+    aioredis = None
+
+async def _read_json(resp) -> Any:
+    """Decode an aiohttp response body with orjson when available
+
+    orjson.loads works straight off the raw bytes, skipping the text
+    decode that resp.json() performs; falls back to stdlib parsing.
+    """
+    if orjson is not None:
+        return orjson.loads(await resp.read())
+    return await resp.json()
+
+def _json_loads(raw) -> Any:
+    """orjson-backed loads with stdlib fallback"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _json_dumps_bytes(value: Any) -> bytes:
+    """Serialize to UTF-8 bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+# The Selenium stack (plus webdriver_manager and selenium_stealth) costs
+# tens of MB of resident memory and noticeable import time, but is only
+# needed for the browser-based scraping paths. It is loaded on first
+# browser init via _import_selenium(); API-key-only runs never pay for it.
+webdriver = ChromeOptions = By = Keys = ActionChains = None
+Service = Options = TimeoutException = WebDriverWait = EC = None
+ChromeDriverManager = stealth = None
+
+def _import_selenium() -> None:
+    """Load the Selenium stack on demand (cached by sys.modules afterwards)"""
+    global webdriver, ChromeOptions, By, Keys, ActionChains, Service, Options
+    global TimeoutException, WebDriverWait, EC, ChromeDriverManager, stealth
+
+    if webdriver is not None:
+        return
+
+    from selenium import webdriver
+    from selenium.webdriver import ChromeOptions
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from webdriver_manager.chrome import ChromeDriverManager
+    from selenium_stealth import stealth
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -86,8 +155,17 @@ class Config:
             if cls.PROXY_ENABLED:
                 proxy_source = os.getenv('PROXY_LIST', 'proxies.txt')
                 if os.path.exists(proxy_source):
-                    with open(proxy_source) as f:
-                        cls.PROXY_LIST = [p.strip() for p in f if p.strip()]
+                    if os.path.getsize(proxy_source) == 0:
+                        cls.PROXY_LIST = []
+                    else:
+                        # One mmap'd read + C-level split, deduplicated via a
+                        # set; avoids per-line Python iteration on big lists
+                        with open(proxy_source, 'rb') as f, \
+                                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                            cls.PROXY_LIST = list({
+                                line.strip().decode()
+                                for line in m.read().splitlines() if line.strip()
+                            })
                 else:
                     cls.PROXY_LIST = [p.strip() for p in proxy_source.split(',') if p.strip()]
             
@@ -163,32 +241,176 @@ class ProgressTracker:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.progress.stop()
 
+# ========== CONCURRENCY LIMITER ========== #
+class DynamicLimiter:
+    """Semaphore-like limiter whose cap can be resized safely at runtime"""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.active = 0
+        self._lock = asyncio.Lock()
+        self._cond = asyncio.Condition(self._lock)
+
+    async def acquire(self):
+        """Wait until a slot is free, then claim it"""
+        async with self._cond:
+            while self.active >= self.cap:
+                await self._cond.wait()
+            self.active += 1
+
+    async def release(self):
+        """Free a slot and wake one waiter"""
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+
+    async def set_cap(self, cap: int):
+        """Resize the cap; waking all waiters when it grows is enough,
+        shrinking simply lets in-flight work drain naturally"""
+        async with self._cond:
+            self.cap = max(1, cap)
+            self._cond.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
+
+# ========== TOKEN BUCKET RATE LIMITER ========== #
+class AsyncTokenBucket:
+    """Per-domain token bucket: absorbs bursts while enforcing average rate"""
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens refilled per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, n: float = 1.0):
+        """Take n tokens, sleeping until the bucket has refilled enough"""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                # Restart the refill window after the sleep, otherwise the
+                # next caller re-credits the slept interval and the bucket
+                # admits roughly double the configured rate
+                self.last = time.monotonic()
+                self.tokens = 0.0
+            else:
+                self.tokens -= n
+
+    def penalize(self, tokens: float = 1.0):
+        """Push the bucket into debt after a 429 or blocking response"""
+        self.tokens = min(self.tokens, -tokens)
+
+# One bucket per target domain; rates mirror the delays they replace
+BUCKETS = {
+    "linkedin.com": AsyncTokenBucket(rate=5 / 60, capacity=5),
+    "google.com": AsyncTokenBucket(rate=1 / 1.5, capacity=3),
+    "baidu.com": AsyncTokenBucket(rate=1 / 1.5, capacity=3),
+    "hunter.io": AsyncTokenBucket(rate=2.0, capacity=4),
+}
+
+# ========== SHARED CONNECTION POOL ========== #
+_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+
+def _shared_connector() -> aiohttp.TCPConnector:
+    """Process-wide TCP connector shared by every ClientSession
+
+    Keep-alive and the DNS cache live in the connector, so sharing one
+    pool means a host resolved or handshaked by any scraper is free for
+    all the others. Built lazily so it binds to the running event loop.
+    """
+    global _CONNECTOR
+    if _CONNECTOR is None or _CONNECTOR.closed:
+        _CONNECTOR = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+    return _CONNECTOR
+
+def _pooled_session(**kwargs) -> aiohttp.ClientSession:
+    """ClientSession on the shared pool; closing it leaves the pool open"""
+    kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT))
+    return aiohttp.ClientSession(
+        connector=_shared_connector(), connector_owner=False, **kwargs
+    )
+
+async def _close_shared_connector() -> None:
+    """Close the process-wide pool once, at shutdown"""
+    global _CONNECTOR
+    if _CONNECTOR is not None and not _CONNECTOR.closed:
+        await _CONNECTOR.close()
+    _CONNECTOR = None
+
+# ========== CIRCUIT BREAKER ========== #
+class BlockedError(Exception):
+    """Raised when a target keeps serving blocking/captcha pages"""
+    pass
+
+class CircuitBreaker:
+    """Opens after repeated blocking hits and rejects calls during cooldown"""
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def record_failure(self) -> None:
+        """Count a blocking hit; open the breaker once the threshold is met"""
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Reset after a clean request"""
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def check(self) -> None:
+        """Raise BlockedError while the breaker is open; half-open after cooldown"""
+        if not self.opened_at:
+            return
+        elapsed = time.monotonic() - self.opened_at
+        if elapsed < self.cooldown:
+            raise BlockedError(
+                f"Circuit open after {self.failures} blocking hits; "
+                f"retry in {self.cooldown - elapsed:.0f}s"
+            )
+        # Cooldown elapsed: allow the next attempt through
+        self.failures = 0
+        self.opened_at = 0.0
+
 # ========== PROXY MANAGER ========== #
 class ProxyManager:
     """Rotating proxy management system"""
     def __init__(self, proxy_list: List[str] = None):
-        self.proxies = proxy_list or []
-        self.current_index = 0
-        self.failed_proxies = set()
-        
+        # Deque of live proxies: rotation is O(1) and failed proxies
+        # simply drop out instead of being skipped on every pick
+        self.live = deque(proxy_list or [])
+
     def get_next_proxy(self) -> Optional[str]:
         """Get next available proxy in rotation"""
-        if not self.proxies:
-            return None
-            
-        if len(self.failed_proxies) >= len(self.proxies):
-            return None  # All proxies failed
-            
-        while True:
-            proxy = self.proxies[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.proxies)
-            if proxy not in self.failed_proxies:
-                return proxy
-                
+        if not self.live:
+            return None  # No proxies left (empty list or all failed)
+
+        proxy = self.live[0]
+        self.live.rotate(-1)
+        return proxy
+
     def mark_failed(self, proxy: str):
-        """Mark a proxy as failed"""
-        if proxy in self.proxies:
-            self.failed_proxies.add(proxy)
+        """Remove a failed proxy from rotation"""
+        try:
+            self.live.remove(proxy)
+        except ValueError:
+            pass
             
     def get_proxy_dict(self, proxy: str) -> Dict:
         """Format proxy for aiohttp/requests"""
@@ -200,7 +422,151 @@ class ProxyManager:
         else:
             return {'http': f'http://{proxy}', 'https': f'https://{proxy}'}
 
+# ========== COMPILED PATTERNS ========== #
+# Hot-path regexes and CSS selectors compiled once at import instead of
+# per call inside the parse/validation loops
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+# Bulk variant: validates a whole newline-joined candidate batch in one
+# findall instead of one fullmatch call per address
+_EMAIL_RE_MULTI = re.compile(r"(?m)^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+_PHONE_RE = re.compile(r"[^\d+]")
+_NON_WORD_RE = re.compile(r"[^\w]")
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+
+# Selectors for the BeautifulSoup fallback parser in LinkedInScraper
+_SS_CONTAINER = soupsieve.compile(".search-results-container")
+_SS_ENTITY = soupsieve.compile(".entity-result")
+_SS_NAME = soupsieve.compile(".entity-result__title-text a")
+_SS_PRIMARY = soupsieve.compile(".entity-result__primary-subtitle")
+_SS_SECONDARY = soupsieve.compile(".entity-result__secondary-subtitle")
+
+# Anti-bot interstitial phrases, compiled into one Aho-Corasick automaton
+# so blocking detection is a single C-level pass over the page source
+# instead of one substring scan per phrase
+BLOCKING_INDICATORS = (
+    "security check", "captcha", "verification",
+    "too many requests", "restricted", "blocked",
+)
+if ahocorasick is not None:
+    _BLOCKING_AUTOMATON = ahocorasick.Automaton()
+    for _indicator in BLOCKING_INDICATORS:
+        _BLOCKING_AUTOMATON.add_word(_indicator, _indicator)
+    _BLOCKING_AUTOMATON.make_automaton()
+    del _indicator
+else:
+    _BLOCKING_AUTOMATON = None
+
+def _contains_blocking_indicator(text: str) -> bool:
+    """One-pass scan of lowercased page text for anti-bot phrases"""
+    if _BLOCKING_AUTOMATON is not None:
+        return next(_BLOCKING_AUTOMATON.iter(text), None) is not None
+    return any(indicator in text for indicator in BLOCKING_INDICATORS)
+
+# Seniority keywords for profile-quality scoring: tokenized titles are
+# intersected with these instead of running a substring scan per keyword
+_SENIOR_HIGH = frozenset({"manager", "director", "vp", "ceo", "cto", "cfo"})
+_SENIOR_MID = frozenset({"founder", "owner", "principal"})
+
+def _url_fingerprint(url: str) -> int:
+    """64-bit fingerprint for URL dedup sets
+
+    Ints hash and compare in one machine word where the URL strings the
+    sets used to hold cost ~100 bytes each plus a strcmp per collision;
+    falls back to the built-in hash when xxhash is absent.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(url)
+    return hash(url)
+
+# Only pools past this size are worth the bitmap detour; small ones are
+# cheaper as a plain set
+_LARGE_POOL_THRESHOLD = 10_000
+
+def _dedupe_email_pool(emails: List[str]) -> Set[str]:
+    """Dedupe a validated candidate pool
+
+    Large pools (bulk enrichment runs merging thousands of addresses per
+    domain) are fingerprinted with xxhash into a Roaring bitmap, which
+    keeps membership tests in C and the footprint at a few hundred KB
+    where a str set would take megabytes. Small pools, or installs
+    without pyroaring/xxhash, use a plain set.
+    """
+    if BitMap64 is None or len(emails) <= _LARGE_POOL_THRESHOLD:
+        return set(emails)
+
+    seen = BitMap64()
+    table = {}
+    for email in emails:
+        fingerprint = xxhash.xxh64_intdigest(email)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            table[fingerprint] = email
+    return set(table.values())
+
+# ========== SHARED SERP HTML CACHE ========== #
+# Raw SERP HTML keyed by normalized URL and shared across all scraper
+# instances, so identical (title, location, industry) queries issued by
+# different workers cost one fetch instead of one ScrapingBee call each.
+_SERP_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_SERP_CACHE_TTL = 3600.0  # seconds
+_SERP_CACHE_MAX = 1024
+
+def _normalize_serp_url(url: str) -> str:
+    """Canonical cache key: sort query params so ?a=1&b=2 == ?b=2&a=1"""
+    base, _, query = url.partition("?")
+    return f"{base}?{urlencode(sorted(parse_qsl(query)))}" if query else base
+
+def _serp_cache_get(url: str) -> Optional[str]:
+    """Return cached HTML for the URL, or None on miss/expiry"""
+    key = _normalize_serp_url(url)
+    entry = _SERP_CACHE.get(key)
+    if entry is None:
+        return None
+    fetched_at, html = entry
+    if time.monotonic() - fetched_at > _SERP_CACHE_TTL:
+        del _SERP_CACHE[key]
+        return None
+    _SERP_CACHE.move_to_end(key)
+    return html
+
+def _serp_cache_put(url: str, html: str) -> None:
+    """Store HTML under the normalized URL, evicting the oldest entries"""
+    _SERP_CACHE[_normalize_serp_url(url)] = (time.monotonic(), html)
+    while len(_SERP_CACHE) > _SERP_CACHE_MAX:
+        _SERP_CACHE.popitem(last=False)
+
+# ========== STATIC TAXONOMY DATA ========== #
+# Large lookup tables (industry synonyms, language map, continents) live
+# in data/taxonomy.json so each interpreter loads them once from disk
+# instead of rebuilding big dict literals at import time; the frozen
+# views keep them read-only and shareable across forked workers.
+_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "taxonomy.json"
+)
+with open(_TAXONOMY_PATH, encoding="utf-8") as _f:
+    _TAXONOMY = json.load(_f)
+
+INDUSTRY_SYNONYMS = MappingProxyType({
+    industry: frozenset(variants)
+    for industry, variants in _TAXONOMY["industry_synonyms"].items()
+})
+LANGUAGE_MAP = MappingProxyType(_TAXONOMY["language_map"])
+CONTINENTS = MappingProxyType({
+    continent: frozenset(codes)
+    for continent, codes in _TAXONOMY["continents"].items()
+})
+
 # ========== AI QUERY OPTIMIZER ========== #
+# Country alias expansions for _expand_location: any trigger substring
+# found in the location pulls in the whole alias set
+_COUNTRY_ALIASES = {
+    frozenset({"usa", "united states"}):
+        frozenset({"us", "united states", "america", "usa"}),
+    frozenset({"uk", "united kingdom"}):
+        frozenset({"united kingdom", "great britain", "england", "gb", "uk"}),
+}
+
+
 class AIQueryOptimizer:
     """
     Enhanced query optimization with more comprehensive expansions
@@ -230,136 +596,165 @@ class AIQueryOptimizer:
         ]
     }
 
-    INDUSTRY_SYNONYMS = {
-        "technology": [
-    "software", "hardware", "IT", "cloud", "cybersecurity", "ai", "machine learning", 
-    "blockchain", "fintech", "edtech", "healthtech", "saas", "iot", "gaming", "web3"
-  ],
-  "finance": [
-    "banking", "investment", "asset management", "private equity", "venture capital", 
-    "accounting", "insurance", "fintech", "cryptocurrency", "hedge funds", "stock trading"
-  ],
-  "healthcare": [
-    "pharmaceuticals", "biotech", "medical devices", "hospitals", "telemedicine", 
-    "health insurance", "clinics", "mental health", "healthtech"
-  ],
-  "construction": [
-    "civil engineering", "architecture", "real estate development", "contracting", 
-    "infrastructure", "urban planning", "construction management", "green building"
-  ],
-  "manufacturing": [
-    "automotive", "aerospace", "electronics", "textiles", "industrial equipment", 
-    "3D printing", "robotics", "supply chain", "chemicals"
-  ],
-  "retail": [
-    "ecommerce", "fashion", "consumer goods", "luxury", "supermarkets", 
-    "dropshipping", "marketplaces", "direct-to-consumer (DTC)"
-  ],
-  "energy": [
-    "oil & gas", "renewables", "solar", "wind", "nuclear", "utilities", 
-    "energy storage", "electric vehicles (EV)", "smart grid"
-  ],
-  "education": [
-    "edtech", "e-learning", "higher education", "K-12", "vocational training", 
-    "tutoring", "online courses", "corporate training"
-  ],
-  "entertainment": [
-    "media", "film & TV", "music", "streaming", "gaming", "esports", 
-    "publishing", "social media", "virtual reality (VR)"
-  ],
-  "transportation": [
-    "logistics", "aviation", "shipping", "rail", "autonomous vehicles", 
-    "ride-sharing", "public transit", "last-mile delivery"
-        ],
-
-    }
+    # Shared frozen table loaded from data/taxonomy.json
+    INDUSTRY_SYNONYMS = INDUSTRY_SYNONYMS
+
+    # Precomputed lookup tables: frozen variant sets plus inverted indexes
+    # so matching is a hashed lookup instead of a scan over every category
+    _ROLE_VARIANTS = {role: frozenset(variants) for role, variants in ROLE_HIERARCHY.items()}
+    _VARIANT_TO_ROLE = {variant: role for role, variants in ROLE_HIERARCHY.items()
+                        for variant in variants}
+    _INDUSTRY_VARIANTS = {industry: frozenset(variants)
+                          for industry, variants in INDUSTRY_SYNONYMS.items()}
+    _VARIANT_TO_INDUSTRY = {variant: industry for industry, variants in INDUSTRY_SYNONYMS.items()
+                            for variant in variants}
+
+    @staticmethod
+    def _match_candidates(text: str) -> Set[str]:
+        """Full string plus word unigrams/bigrams, for inverted-index lookups"""
+        words = text.split()
+        candidates = {text}
+        candidates.update(words)
+        candidates.update(" ".join(pair) for pair in zip(words, words[1:]))
+        return candidates
+
+    @staticmethod
+    def _build_automaton(variant_to_category: Dict[str, str]):
+        """Compile all variants into one Aho-Corasick automaton so a single
+        O(len(text)) pass finds every matching category; returns None when
+        pyahocorasick is not installed"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for variant, category in variant_to_category.items():
+            automaton.add_word(variant, category)
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _matched_categories(text: str, automaton, variant_index: Dict[str, str]) -> Set[str]:
+        """All categories whose variants occur in text: one automaton pass
+        when available, inverted-index lookups otherwise"""
+        if automaton is not None:
+            return {category for _, category in automaton.iter(text)}
+        return {
+            variant_index[candidate]
+            for candidate in AIQueryOptimizer._match_candidates(text)
+            if candidate in variant_index
+        }
 
-    @classmethod
-    def expand_query(cls, job_title: str, industry: str, location: str) -> Tuple[List[str], List[str], List[str]]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def expand_query(job_title: str, industry: str, location: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
         """
         Generate multiple search variations with enhanced logic
-        Returns: (titles, industries, locations)
+        Returns: (titles, industries, locations) as immutable tuples so
+        repeated (title, industry, location) combinations hit the cache
         """
-        titles = cls._expand_titles(job_title.lower())
-        industries = cls._expand_industries(industry.lower())
-        locations = cls._expand_location(location)
-        
+        # Normalize before caching so trivially different spellings share entries
+        job_title = job_title.strip().lower()
+        industry = industry.strip().lower()
+        location = location.strip()
+
+        titles = AIQueryOptimizer._expand_titles(job_title)
+        industries = AIQueryOptimizer._expand_industries(industry)
+        locations = AIQueryOptimizer._expand_location(location)
+
         # Limit expansion depth and ensure variety
-        titles = sorted(list(set(titles)), key=lambda x: (len(x), x))[:Config.AI_EXPANSION_DEPTH]
-        industries = sorted(list(set(industries)), key=lambda x: (len(x), x))[:Config.AI_EXPANSION_DEPTH]
-        locations = sorted(list(set(locations)), key=len)[:Config.AI_EXPANSION_DEPTH]
-        
+        titles = tuple(sorted(set(titles), key=lambda x: (len(x), x))[:Config.AI_EXPANSION_DEPTH])
+        industries = tuple(sorted(set(industries), key=lambda x: (len(x), x))[:Config.AI_EXPANSION_DEPTH])
+        locations = tuple(sorted(set(locations), key=len)[:Config.AI_EXPANSION_DEPTH])
+
         return titles, industries, locations
     
-    @classmethod
-    def _expand_location(cls, location: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _expand_location(location: str) -> Tuple[str, ...]:
         """Generate related location terms"""
         expanded = {location}
-        
+
         # Add common variations
         if ", " in location:
             city, country = location.split(", ", 1)
             expanded.add(city)
             expanded.add(country)
             expanded.add(f"{city} {country}")
-        
+
         # Handle country/state variations
-        if "usa" in location.lower() or "united states" in location.lower():
-            expanded.update(["us", "united states", "america", "usa"])
-        elif "uk" in location.lower() or "united kingdom" in location.lower():
-            expanded.update(["united kingdom", "great britain", "england", "gb", "uk"])
-        
+        location_lower = location.lower()
+        for triggers, aliases in _COUNTRY_ALIASES.items():
+            if any(t in location_lower for t in triggers):
+                expanded |= aliases
+                break
+
         # Add common abbreviations
         if len(location.split()) > 1:
             expanded.add("".join(word[0] for word in location.split()))
-        
-        return list(expanded)
-        
-    @classmethod
-    def _expand_titles(cls, title: str) -> List[str]:
+
+        return tuple(expanded)
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _expand_titles(title: str) -> Tuple[str, ...]:
         """Generate related job titles with more variations"""
         expanded = {title}
-        
+
         # Add common variations
         if " " in title:
             expanded.add(title.replace(" ", "-"))
             expanded.add(title.replace(" ", ""))
-        
-        # Add hierarchical variations
-        for role, variants in cls.ROLE_HIERARCHY.items():
-            if any(v in title for v in variants):
-                expanded.update(variants)
-                expanded.update(f"senior {v}" for v in variants)
-                expanded.update(f"chief {v}" for v in variants if v not in ["ceo", "cto", "cfo", "cio"])
-        
+
+        # Add hierarchical variations: one automaton pass over the title
+        matched_roles = AIQueryOptimizer._matched_categories(
+            title, AIQueryOptimizer._TITLE_AUTOMATON, AIQueryOptimizer._VARIANT_TO_ROLE
+        )
+        for role in matched_roles:
+            variants = AIQueryOptimizer._ROLE_VARIANTS[role]
+            expanded.update(variants)
+            expanded.update(f"senior {v}" for v in variants)
+            expanded.update(f"chief {v}" for v in variants if v not in ("ceo", "cto", "cfo", "cio"))
+
         # Add common prefixes/suffixes
-        prefixes = ["lead", "senior", "junior", "chief", "principal", "head of"]
-        suffixes = ["manager", "director", "specialist", "engineer"]
-        
+        prefixes = ("lead", "senior", "junior", "chief", "principal", "head of")
+        suffixes = ("manager", "director", "specialist", "engineer")
+
         base_title = title.split()[-1]
         for prefix in prefixes:
             expanded.add(f"{prefix} {base_title}")
         for suffix in suffixes:
             expanded.add(f"{base_title} {suffix}")
-        
-        return list(expanded)
-        
-    @classmethod
-    def _expand_industries(cls, industry: str) -> List[str]:
+
+        return tuple(expanded)
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _expand_industries(industry: str) -> Tuple[str, ...]:
         """Generate related industry terms"""
-        expanded = {industry.lower()}
-        
+        industry = industry.lower()
+        expanded = {industry}
+
         # Add common variations
         if " " in industry:
             expanded.add(industry.replace(" ", "-"))
             expanded.add(industry.replace(" ", ""))
-        
-        # Add synonyms from INDUSTRY_SYNONYMS
-        for main_industry, variants in cls.INDUSTRY_SYNONYMS.items():
-            if any(v in industry.lower() for v in variants):
-                expanded.update(variants)
-        
-        return list(expanded)[:Config.AI_EXPANSION_DEPTH]
+
+        # Add synonyms: one automaton pass over the industry string
+        matched = AIQueryOptimizer._matched_categories(
+            industry, AIQueryOptimizer._INDUSTRY_AUTOMATON, AIQueryOptimizer._VARIANT_TO_INDUSTRY
+        )
+        for main_industry in matched:
+            expanded.update(AIQueryOptimizer._INDUSTRY_VARIANTS[main_industry])
+
+        return tuple(expanded)[:Config.AI_EXPANSION_DEPTH]
+
+# Build the automatons once at import (None when pyahocorasick is missing,
+# in which case matching falls back to the inverted indexes)
+AIQueryOptimizer._TITLE_AUTOMATON = AIQueryOptimizer._build_automaton(
+    AIQueryOptimizer._VARIANT_TO_ROLE
+)
+AIQueryOptimizer._INDUSTRY_AUTOMATON = AIQueryOptimizer._build_automaton(
+    AIQueryOptimizer._VARIANT_TO_INDUSTRY
+)
 
 # ========== API MANAGER ========== #
 class APIVault:
@@ -384,6 +779,11 @@ class APIVault:
         }
     }
 
+    # Compile each service's key pattern once at class load
+    for _cfg in SERVICES.values():
+        _cfg["regex"] = re.compile(_cfg["pattern"])
+    del _cfg
+
     @classmethod
     async def configure(cls):
         """Interactive API key setup with clear explanations"""
@@ -405,7 +805,7 @@ class APIVault:
             while True:
                 key = await questionary.text(
                     f"Enter your {service} API key (or press Enter to skip):",
-                    validate=lambda x: True if not x or re.match(config["pattern"], x) 
+                    validate=lambda x: True if not x or config["regex"].match(x)
                     else f"Invalid format! {config['help']}"
                 ).unsafe_ask_async()
                 
@@ -416,7 +816,7 @@ class APIVault:
                         console.print(f"[dim]Skipping {service}[/]")
                     break
                     
-                if re.match(config["pattern"], key):
+                if config["regex"].match(key):
                     keys[service] = key
                     console.print(f"[green]✓ {service} key accepted[/]")
                     break
@@ -427,118 +827,8 @@ class APIVault:
 
 # ========== LANGUAGE SUPPORT ========== #
 class PolyglotScraper:
-    LANGUAGE_MAP = {
-  "English": {
-    "code": "en",
-    "titles": {
-      "CEO": "CEO",
-      "Manager": "Manager",
-      "Founder": "Founder",
-      "Engineer": "Engineer"
-    },
-    "google_domain": "google.com",
-    "linkedin_domain": "www.linkedin.com"
-  },
-  "Japanese": {
-    "code": "ja",
-    "titles": {
-      "CEO": "代表取締役社長",
-      "Manager": "マネージャー",
-      "Founder": "創業者",
-      "Engineer": "エンジニア"
-    },
-    "google_domain": "google.co.jp",
-    "linkedin_domain": "jp.linkedin.com"
-  },
-  "Spanish": {
-    "code": "es",
-    "titles": {
-      "CEO": "Director Ejecutivo",
-      "Manager": "Gerente",
-      "Founder": "Fundador",
-      "Engineer": "Ingeniero"
-    },
-    "google_domain": "google.es",
-    "linkedin_domain": "es.linkedin.com"
-  },
-  "German": {
-    "code": "de",
-    "titles": {
-      "CEO": "Geschäftsführer",
-      "Manager": "Manager",
-      "Founder": "Gründer",
-      "Engineer": "Ingenieur"
-    },
-    "google_domain": "google.de",
-    "linkedin_domain": "de.linkedin.com"
-  },
-  "French": {
-    "code": "fr",
-    "titles": {
-      "CEO": "PDG",
-      "Manager": "Manager",
-      "Founder": "Fondateur",
-      "Engineer": "Ingénieur"
-    },
-    "google_domain": "google.fr",
-    "linkedin_domain": "fr.linkedin.com"
-  },
-  "Chinese (Simplified)": {
-    "code": "zh",
-    "titles": {
-      "CEO": "首席执行官",
-      "Manager": "经理",
-      "Founder": "创始人",
-      "Engineer": "工程师"
-    },
-    "google_domain": "google.cn",
-    "linkedin_domain": "cn.linkedin.com"
-  },
-  "Portuguese": {
-    "code": "pt",
-    "titles": {
-      "CEO": "Diretor Executivo",
-      "Manager": "Gerente",
-      "Founder": "Fundador",
-      "Engineer": "Engenheiro"
-    },
-    "google_domain": "google.com.br",
-    "linkedin_domain": "br.linkedin.com"
-  },
-  "Russian": {
-    "code": "ru",
-    "titles": {
-      "CEO": "Генеральный директор",
-      "Manager": "Менеджер",
-      "Founder": "Основатель",
-      "Engineer": "Инженер"
-    },
-    "google_domain": "google.ru",
-    "linkedin_domain": "ru.linkedin.com"
-  },
-  "Arabic": {
-    "code": "ar",
-    "titles": {
-      "CEO": "الرئيس التنفيذي",
-      "Manager": "مدير",
-      "Founder": "مؤسس",
-      "Engineer": "مهندس"
-    },
-    "google_domain": "google.com.sa",
-    "linkedin_domain": "sa.linkedin.com"
-  },
-  "Hindi": {
-    "code": "hi",
-    "titles": {
-      "CEO": "मुख्य कार्यकारी अधिकारी",
-      "Manager": "प्रबंधक",
-      "Founder": "संस्थापक",
-      "Engineer": "इंजीनियर"
-    },
-    "google_domain": "google.co.in",
-    "linkedin_domain": "in.linkedin.com"
-  }
-}
+    # Shared frozen table loaded from data/taxonomy.json
+    LANGUAGE_MAP = LANGUAGE_MAP
 
     @classmethod
     async def select_language(cls):
@@ -556,35 +846,9 @@ class PolyglotScraper:
         
 # ========== GEO TARGETING ========== #
 class GeoExplorer:
-    CONTINENTS = {
-  "Africa": [
-    "DZ", "AO", "BJ", "BW", "BF", "BI", "CV", "CM", "CF", "TD", "KM", "CG", "CD", "CI", "DJ", "EG", "GQ", "ER", "SZ", "ET", 
-    "GA", "GM", "GH", "GN", "GW", "KE", "LS", "LR", "LY", "MG", "MW", "ML", "MR", "MU", "MA", "MZ", "NA", "NE", "NG", "RW", 
-    "ST", "SN", "SC", "SL", "SO", "ZA", "SS", "SD", "TZ", "TG", "TN", "UG", "ZM", "ZW"
-  ],
-  "Asia": [
-    "AF", "AM", "AZ", "BH", "BD", "BT", "BN", "KH", "CN", "CY", "GE", "IN", "ID", "IR", "IQ", "IL", "JP", "JO", "KZ", "KW", 
-    "KG", "LA", "LB", "MY", "MV", "MN", "MM", "NP", "KP", "OM", "PK", "PH", "QA", "RU", "SA", "SG", "KR", "LK", "SY", "TW", 
-    "TJ", "TH", "TL", "TR", "TM", "AE", "UZ", "VN", "YE", "PS"
-  ],
-  "Europe": [
-    "AL", "AD", "AT", "BY", "BE", "BA", "BG", "HR", "CZ", "DK", "EE", "FI", "FR", "DE", "GR", "HU", "IS", "IE", "IT", "XK", 
-    "LV", "LI", "LT", "LU", "MT", "MD", "MC", "ME", "NL", "MK", "NO", "PL", "PT", "RO", "SM", "RS", "SK", "SI", "ES", "SE", 
-    "CH", "UA", "GB", "VA"
-  ],
-  "North America": [
-    "AG", "BS", "BB", "BZ", "CA", "CR", "CU", "DM", "DO", "SV", "GD", "GT", "HT", "HN", "JM", "MX", "NI", "PA", "KN", "LC", 
-    "VC", "TT", "US"
-  ],
-  "Oceania": [
-    "AU", "FJ", "KI", "MH", "FM", "NR", "NZ", "PW", "PG", "WS", "SB", "TO", "TV", "VU", "AS", "CK", "PF", "GU", "NC", "NU", 
-    "MP", "PN", "TK", "WF"
-  ],
-  "South America": [
-    "AR", "BO", "BR", "CL", "CO", "EC", "GY", "PY", "PE", "SR", "UY", "VE"
-  ],
-  "Antarctica": ["AQ"]
-}
+    # Shared frozen table loaded from data/taxonomy.json
+    CONTINENTS = CONTINENTS
+
     @classmethod
     async def select_region(cls):
         """Select target region with validation"""
@@ -603,10 +867,82 @@ class GeoExplorer:
             console.print("[yellow]Invalid region selected, please try again[/]")
             
 # ========== BASE SCRAPER CLASS ========== #
+# Realistic desktop/mobile user agents sampled by _get_realistic_user_agent
+_USER_AGENTS = (
+    # Windows
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+
+    # macOS
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+
+    # Linux
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+
+    # Mobile
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (Linux; Android 14; SM-S928U) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Mobile Safari/537.36",
+)
+
+# Chrome arguments shared by every browser the scrapers launch.
+# Note: "--disable-blink-features" without a value must NOT be added next
+# to "--disable-blink-features=AutomationControlled" - the bare flag
+# overrides the valued one and re-enables automation fingerprinting.
+_CHROME_BASE_ARGS = (
+    # Anti-bot detection settings
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--disable-popup-blocking",
+    "--disable-notifications",
+    "--disable-web-security",
+    "--disable-extensions",
+    # Performance and stability
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+)
+
+_driver_path_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process
+
+    A CHROMEDRIVER_PATH env var (e.g. a driver baked into the deploy
+    image) wins outright and skips all probing. Otherwise PATH is
+    checked before ChromeDriverManager().install(), which probes the
+    installed Chrome version and may hit the network; the lock keeps
+    concurrent first calls from racing the download.
+    """
+    pinned = os.environ.get("CHROMEDRIVER_PATH")
+    if pinned:
+        return pinned
+    with _driver_path_lock:
+        return shutil.which("chromedriver") or ChromeDriverManager().install()
+
+# Every WebDriver call is a synchronous HTTP round trip to the browser;
+# running them on a dedicated pool keeps the event loop free so the
+# aiohttp legs (ScrapingBee, Hunter) overlap with browser navigation
+_SELENIUM_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+async def _in_selenium_pool(fn, *args):
+    """Run a blocking WebDriver call without stalling the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(_SELENIUM_POOL, fn, *args)
+
+
 class Scraper(ABC):
-    def __init__(self, progress: ProgressTracker):
+    def __init__(self, progress: ProgressTracker, session: Optional[aiohttp.ClientSession] = None):
         self.progress = progress
-        self.ua = UserAgent()
+        # Shared session injected by the orchestrator; falls back to a
+        # private one (closed in cleanup) when none is provided
+        self.session = session
+        self._owns_session = session is None
+
+    @cached_property
+    def ua(self):
+        """fake-useragent database, loaded lazily on first use"""
+        from fake_useragent import UserAgent
+        return UserAgent()
 
     @abstractmethod
     async def scrape(self, query: Dict):
@@ -627,104 +963,125 @@ class Scraper(ABC):
         
 # ========== LINKEDIN SCRAPER ========== #
 class LinkedInScraper(Scraper):
-    def __init__(self, progress: ProgressTracker, api_key: str = None, 
-                 lang_config: dict = None, proxy_manager: ProxyManager = None):
+    def __init__(self, progress: ProgressTracker, api_key: str = None,
+                 lang_config: dict = None, proxy_manager: ProxyManager = None,
+                 session: aiohttp.ClientSession = None):
         """
         Enhanced LinkedIn scraper with:
         - Better anti-detection measures
         - Improved error handling
         - Realistic human-like behavior
         """
-        super().__init__(progress)
+        super().__init__(progress, session)
         self.api_key = api_key
         self.lang_config = lang_config or {"code": "en", "titles": {}}
         self.proxy_manager = proxy_manager
         self.driver = None
-        self.session = None
-        self.retry_count = 0
-        self.RATE_LIMIT = 5  # requests per minute
-        self.last_request_time = 0
         self._login_attempted = False
+        self._api_cache: Dict[str, List[Dict]] = {}  # Per-URL ScrapingBee results
+
+    # Restrict the BS4 fallback parse to the results container only
+    _RESULTS_STRAINER = SoupStrainer("div", class_="search-results-container")
+
+    @cached_property
+    def _browser_user_agent(self) -> str:
+        """One consistent user agent per scraper lifetime: the command-line
+        UA and the CDP override must match or the mismatch itself becomes
+        a detection signal"""
+        return self._get_realistic_user_agent()
+
+    # Admission control: cap concurrent LinkedIn requests across all queries;
+    # the cap shrinks when blocking is detected
+    _limiter = DynamicLimiter(8)
+
+    # Shared breaker: stop hammering LinkedIn after repeated blocking pages
+    _breaker = CircuitBreaker(threshold=5, cooldown=60.0)
 
     async def scrape(self, query: Dict) -> List[Dict]:
-        """Main scraping method with comprehensive error handling"""
+        """Main scraping method with bounded concurrency and retries"""
+        async with self._limiter:
+            try:
+                return await self._scrape_once(query)
+            except Exception as e:
+                logger.error(f"LinkedIn Error: {str(e)}")
+                return []
+
+    @retry(stop=stop_after_attempt(Config.MAX_RETRIES),
+           wait=wait_exponential(multiplier=1, min=2, max=60) + wait_random(0, 1),
+           retry=retry_if_exception_type(aiohttp.ClientError))
+    async def _scrape_once(self, query: Dict) -> List[Dict]:
+        """Single scrape attempt with comprehensive error handling"""
+        self._breaker.check()
         self.progress.add_task(f"LinkedIn ({query['location']})", total=100)
-        results = []
-        
+
         try:
-            await self._enforce_rate_limit()
-            
-            if not self.api_key and not self.driver:
-                await self._init_browser()
-                if not self._login_attempted:
-                    await self._linkedin_login()
-            
+            await BUCKETS["linkedin.com"].acquire()
+
             url = self._build_linkedin_url(
                 query['job_title'],
                 query['location'],
-                self.lang_config
+                self.lang_config.get('linkedin_domain', 'www.linkedin.com')
             )
-            
+
             if await self._check_for_blocking():
-                raise Exception("LinkedIn blocking detected")
-                
+                # Back off: shrink the concurrency cap while LinkedIn is unhappy
+                await self._limiter.set_cap(self._limiter.cap - 1)
+                self._breaker.record_failure()
+                raise BlockedError("LinkedIn blocking detected")
+
             if self.api_key:
                 results = await self._scrape_via_api(url)
-            else:
-                results = await self._scrape_via_selenium(url)
-            
+                self._breaker.record_success()
+                return results
+
+            # Cheap fast path: plain HTTP fetch, no browser startup
+            try:
+                results = await self._scrape_via_http(url)
+                self._breaker.record_success()
+                return results
+            except (PermissionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"HTTP fast path unavailable, falling back to browser: {str(e)}")
+
+            if not self.driver:
+                await self._init_browser()
+                if not self._login_attempted:
+                    await self._linkedin_login()
+            results = await self._scrape_via_selenium(url)
+            self._breaker.record_success()
             return results
-        
-        except Exception as e:
-            logger.error(f"LinkedIn Error: {str(e)}")
-            if self.retry_count < Config.MAX_RETRIES:
-                self.retry_count += 1
-                await asyncio.sleep(5)
-                return await self.scrape(query)
-            return []
         finally:
             self.progress.complete_task(f"LinkedIn ({query['location']})")
 
     async def _init_browser(self) -> None:
         """Initialize browser with advanced anti-detection measures"""
+        _import_selenium()
         chrome_options = Options()
-        
-        # Anti-bot detection settings
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-blink-features")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-extensions")
-        
-        # Performance and stability
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        
-        # Realistic browser settings
-        chrome_options.add_argument("--window-size=1280,720")
-        chrome_options.add_argument(f"user-agent={self._get_realistic_user_agent()}")
-        
+
+        for arg in _CHROME_BASE_ARGS:
+            chrome_options.add_argument(arg)
+
+        # Realistic browser settings: exactly one window size
         if Config.HEADLESS:
             chrome_options.add_argument("--headless=new")
             chrome_options.add_argument("--window-size=1920,1080")
-        
+        else:
+            chrome_options.add_argument("--window-size=1280,720")
+        chrome_options.add_argument(f"user-agent={self._browser_user_agent}")
+
         # Persistent session
         chrome_options.add_argument("--profile-directory=Default")
         chrome_options.add_argument("--user-data-dir=./chrome_profile")
         
         # Proxy configuration
         if Config.PROXY_ENABLED and self.proxy_manager:
-            proxy = await self.proxy_manager.get_next_proxy()
+            proxy = self.proxy_manager.get_next_proxy()
             if proxy:
                 chrome_options.add_argument(f"--proxy-server={proxy}")
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
+
             # Advanced stealth configuration
             stealth(
                 self.driver,
@@ -739,7 +1096,7 @@ class LinkedInScraper(Scraper):
             # Additional anti-detection tricks
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": self._get_realistic_user_agent()
+                "userAgent": self._browser_user_agent
             })
             
         except Exception as e:
@@ -753,30 +1110,39 @@ class LinkedInScraper(Scraper):
             
         try:
             await self._human_like_delay()
-            self.driver.get("https://www.linkedin.com/login")
-            
+            await _in_selenium_pool(self.driver.get, "https://www.linkedin.com/login")
+
             # Wait for page to load naturally
             await self._human_like_delay(1.0, 2.0)
-            
+
             # Fill credentials with human-like timing
-            username = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
+            username = await _in_selenium_pool(
+                lambda: WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.ID, "username"))
+                )
             )
             await self._type_like_human(username, "your_email@example.com")
-            
-            password = self.driver.find_element(By.ID, "password")
+
+            password = await _in_selenium_pool(
+                self.driver.find_element, By.ID, "password"
+            )
             await self._type_like_human(password, "your_password")
-            
+
             # Random mouse movement before clicking
             await self._move_mouse_to_element(username)
             await self._human_like_delay(0.5, 1.5)
-            
-            submit = self.driver.find_element(By.CSS_SELECTOR, "button[type=submit]")
-            submit.click()
-            
+
+            await _in_selenium_pool(
+                lambda: self.driver.find_element(
+                    By.CSS_SELECTOR, "button[type=submit]"
+                ).click()
+            )
+
             # Wait for login to complete
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.ID, "global-nav"))
+            await _in_selenium_pool(
+                lambda: WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located((By.ID, "global-nav"))
+                )
             )
             self._login_attempted = True
             
@@ -787,6 +1153,47 @@ class LinkedInScraper(Scraper):
             logger.warning(f"Login failed: {str(e)}")
             self._login_attempted = False
 
+    async def _scrape_via_http(self, url: str) -> List[Dict]:
+        """Fetch a public listing URL over plain HTTP and parse with selectolax
+
+        Raises PermissionError when LinkedIn serves the auth wall so the
+        caller can fall back to the Selenium path.
+        """
+        html = _serp_cache_get(url)
+        fetched = html is None
+        if fetched:
+            if not self.session:
+                self.session = _pooled_session()
+
+            headers = {
+                "User-Agent": self._get_realistic_user_agent(),
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": f"{self.lang_config.get('code', 'en')};q=0.9",
+            }
+            proxy = None
+            if Config.PROXY_ENABLED and self.proxy_manager:
+                proxy = self.proxy_manager.get_next_proxy()
+
+            async with self.session.get(
+                url,
+                headers=headers,
+                proxy=proxy,
+                timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
+            ) as resp:
+                if resp.status in (403, 999):
+                    raise PermissionError(f"LinkedIn auth wall (HTTP {resp.status})")
+                resp.raise_for_status()
+                html = await resp.text()
+
+        tree = LexborHTMLParser(html)
+        if tree.css_first(".search-results-container") is None:
+            raise PermissionError("No results container in HTTP response")
+        if fetched:
+            # Only stamp fetched_at on real fetches; re-putting cache hits
+            # would keep refreshing the TTL and serve stale HTML forever
+            _serp_cache_put(url, html)
+        return self._parse_html(tree)
+
     async def _scrape_via_selenium(self, url: str) -> List[Dict]:
         """Scrape using Selenium with human-like interactions"""
         if not self.driver:
@@ -795,154 +1202,302 @@ class LinkedInScraper(Scraper):
         try:
             # Simulate human navigation
             await self._human_like_delay()
-            self.driver.get(url)
-            
+            await _in_selenium_pool(self.driver.get, url)
+
             # Random scrolling
             await self._simulate_scrolling()
-            
+
             # Wait for results naturally
-            WebDriverWait(self.driver, 15).until(
+            await _in_selenium_pool(
+                WebDriverWait(self.driver, 15).until,
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".search-results-container"))
             )
-            
+
             # Check for blocking
             if await self._check_for_blocking():
                 raise Exception("Blocking detected during scraping")
-                
+
             # Additional random delay
             await self._human_like_delay(1.0, 3.0)
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            return self._parse_html(soup)
-            
+
+            html = await _in_selenium_pool(lambda: self.driver.page_source)
+
+            # Very large pages: stream-parse so we never hold the full tree
+            if len(html) > self._STREAM_PARSE_THRESHOLD:
+                results = self._parse_html_streaming(html)
+                if results:
+                    return results
+
+            tree = LexborHTMLParser(html)
+            if tree.css_first(".search-results-container") is None:
+                # Fall back to BeautifulSoup if the lexbor tree misses the container
+                return self._parse_html_soup(
+                    BeautifulSoup(html, "lxml", parse_only=self._RESULTS_STRAINER)
+                )
+            return self._parse_html(tree)
+
         except Exception as e:
             logger.error(f"Selenium scraping failed: {str(e)}")
             raise
 
-    def _parse_html(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse LinkedIn search results with robust error handling"""
+    def _parse_html(self, tree: LexborHTMLParser) -> List[Dict]:
+        """Parse LinkedIn search results from a selectolax tree"""
         results = []
-        container = soup.select_one(".search-results-container")
-        
+        ts = datetime.now().isoformat()  # One timestamp per parsed batch
+        container = tree.css_first(".search-results-container")
+
         if not container:
             logger.error("No results container found - may be blocked")
             return results
-        
-        for result in container.select(".entity-result"):
+
+        for result in container.css(".entity-result"):
             try:
-                # Safely extract all elements
-                name_elem = result.select_one(".entity-result__title-text a")
-                title_elem = result.select_one(".entity-result__primary-subtitle")
-                location_elem = result.select_one(".entity-result__secondary-subtitle")
-                
+                # One walk over the row collects all three fields instead
+                # of three independent css_first subtree searches
+                name_elem = title_elem = location_elem = None
+                for node in result.traverse(include_text=False):
+                    cls = node.attributes.get("class") or ""
+                    if name_elem is None and "entity-result__title-text" in cls:
+                        name_elem = node.css_first("a")
+                    elif title_elem is None and "entity-result__primary-subtitle" in cls:
+                        title_elem = node
+                    elif location_elem is None and "entity-result__secondary-subtitle" in cls:
+                        location_elem = node
+                    if name_elem is not None and title_elem is not None \
+                            and location_elem is not None:
+                        break
+
                 if not all([name_elem, title_elem, location_elem]):
                     continue
-                    
+
                 # Clean and validate URL
-                profile_url = name_elem["href"].split('?')[0]
+                profile_url = name_elem.attributes.get("href", "").split('?')[0]
                 if not profile_url.startswith('http'):
                     profile_url = f"https://www.linkedin.com{profile_url}"
-                
+
+                name = name_elem.text(strip=True)
+                title = title_elem.text(strip=True)
+
                 # Build result dict
+                results.append({
+                    "name": name,
+                    "url": profile_url,
+                    "title": title,
+                    "location": location_elem.text(strip=True),
+                    "source": "LinkedIn",
+                    "timestamp": ts,
+                    "quality_score": self._calculate_profile_quality(name, title)
+                })
+
+            except Exception as e:
+                logger.debug(f"Skipping malformed result: {str(e)}")
+                continue
+
+        return results
+
+    # Pages bigger than this are parsed incrementally instead of as one tree
+    _STREAM_PARSE_THRESHOLD = 1_000_000
+
+    def _parse_html_streaming(self, html: str) -> List[Dict]:
+        """Stream-parse result cards without materializing the full tree
+
+        Feeds the HTML through lxml's pull parser chunk by chunk, extracts
+        each .entity-result card as soon as its subtree closes and clears
+        it, so memory stays bounded on multi-MB pages. Stops early once
+        Config.MAX_RESULTS cards have been collected.
+        """
+        results = []
+        ts = datetime.now().isoformat()  # One timestamp per parsed batch
+        parser = etree.HTMLPullParser(events=("end",))
+        data = html.encode("utf-8", errors="replace")
+
+        try:
+            for offset in range(0, len(data), 65536):
+                parser.feed(data[offset:offset + 65536])
+
+                for _, elem in parser.read_events():
+                    classes = (elem.get("class") or "").split()
+                    if "entity-result" not in classes:
+                        continue
+
+                    name_nodes = elem.xpath(".//*[contains(@class,'entity-result__title-text')]//a")
+                    title_nodes = elem.xpath(".//*[contains(@class,'entity-result__primary-subtitle')]")
+                    location_nodes = elem.xpath(".//*[contains(@class,'entity-result__secondary-subtitle')]")
+
+                    if name_nodes and title_nodes and location_nodes:
+                        # Pull-parser nodes are etree._Element, which has no
+                        # text_content(); itertext() is the etree equivalent
+                        name = "".join(name_nodes[0].itertext()).strip()
+                        title = "".join(title_nodes[0].itertext()).strip()
+
+                        profile_url = (name_nodes[0].get("href") or "").split('?')[0]
+                        if not profile_url.startswith('http'):
+                            profile_url = f"https://www.linkedin.com{profile_url}"
+
+                        results.append({
+                            "name": name,
+                            "url": profile_url,
+                            "title": title,
+                            "location": "".join(
+                                location_nodes[0].itertext()
+                            ).strip(),
+                            "source": "LinkedIn",
+                            "timestamp": ts,
+                            "quality_score": self._calculate_profile_quality(name, title)
+                        })
+
+                    # Free the processed subtree to keep memory flat
+                    elem.clear()
+
+                    if len(results) >= Config.MAX_RESULTS:
+                        return results
+        except etree.XMLSyntaxError as e:
+            logger.debug(f"Streaming parse aborted: {str(e)}")
+
+        return results
+
+    def _parse_html_soup(self, soup: BeautifulSoup) -> List[Dict]:
+        """BeautifulSoup fallback parser for when selectolax misses the container"""
+        results = []
+        ts = datetime.now().isoformat()  # One timestamp per parsed batch
+        container = _SS_CONTAINER.select_one(soup)
+
+        if not container:
+            logger.error("No results container found - may be blocked")
+            return results
+
+        for result in _SS_ENTITY.select(container):
+            try:
+                name_elem = _SS_NAME.select_one(result)
+                title_elem = _SS_PRIMARY.select_one(result)
+                location_elem = _SS_SECONDARY.select_one(result)
+
+                if not all([name_elem, title_elem, location_elem]):
+                    continue
+
+                profile_url = name_elem["href"].split('?')[0]
+                if not profile_url.startswith('http'):
+                    profile_url = f"https://www.linkedin.com{profile_url}"
+
                 results.append({
                     "name": name_elem.text.strip(),
                     "url": profile_url,
                     "title": title_elem.text.strip(),
                     "location": location_elem.text.strip(),
                     "source": "LinkedIn",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": ts,
                     "quality_score": self._calculate_profile_quality(
                         name_elem.text.strip(),
                         title_elem.text.strip()
                     )
                 })
-                
+
             except Exception as e:
                 logger.debug(f"Skipping malformed result: {str(e)}")
                 continue
-                
+
         return results
 
     async def _scrape_via_api(self, url: str) -> List[Dict]:
-        """Scrape using API with comprehensive error handling"""
+        """Scrape using API, trying the cheap no-JS tier first
+
+        ScrapingBee with render_js=true forces a 5s headless-browser wait
+        per URL. The raw HTML often already contains the results, so try
+        render_js=false first and only pay for rendering when the cheap
+        tier parses zero rows. Outcomes are cached per URL so tenacity
+        retries of the surrounding scrape don't re-bill the API.
+        """
+        if url in self._api_cache:
+            return self._api_cache[url]
+
         if not self.session:
-            self.session = aiohttp.ClientSession()
-            
-        params = {
-            "api_key": self.api_key,
-            "url": url,
-            "render_js": "true",
-            "wait_for": ".search-results-container",
-            "wait": "5000",
-            "premium_proxy": "true" if Config.PROXY_ENABLED else "false"
-        }
-        
-        try:
-            async with self.session.get(
-                "https://app.scrapingbee.com/api/v1",
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                
-                if resp.status != 200:
-                    error = await resp.text()
-                    logger.error(f"ScrapingBee error: {error}")
-                    if "proxy" in params:
-                        await self.proxy_manager.mark_failed(params["proxy"])
-                    raise Exception(f"API Error: {error}")
-                
-                html = await resp.text()
-                return self._parse_html(BeautifulSoup(html, 'html.parser'))
-                
-        except Exception as e:
-            logger.error(f"API Request failed: {str(e)}")
-            raise
+            self.session = _pooled_session()
+
+        for tier in ({"render_js": "false", "wait": "0"},
+                     {"render_js": "true", "wait": "5000",
+                      "wait_for": ".search-results-container"}):
+            params = {
+                "api_key": self.api_key,
+                "url": url,
+                "premium_proxy": "true" if Config.PROXY_ENABLED else "false",
+                **tier,
+            }
+
+            try:
+                async with self.session.get(
+                    "https://app.scrapingbee.com/api/v1",
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as resp:
+
+                    if resp.status != 200:
+                        error = await resp.text()
+                        logger.error(f"ScrapingBee error: {error}")
+                        if resp.status == 429:
+                            # Drain the bucket so the next request waits out the limit
+                            BUCKETS["linkedin.com"].penalize(2.0)
+                        if "proxy" in params:
+                            self.proxy_manager.mark_failed(params["proxy"])
+                        raise Exception(f"API Error: {error}")
+
+                    html = await resp.text()
+                    results = self._parse_html(LexborHTMLParser(html))
+                    if results:
+                        self._api_cache[url] = results
+                        return results
+
+            except Exception as e:
+                logger.error(f"API Request failed: {str(e)}")
+                raise
+
+        # Neither tier produced rows; cache the empty outcome as well
+        self._api_cache[url] = []
+        return []
 
     async def cleanup(self) -> None:
         """Comprehensive resource cleanup"""
         try:
             if self.driver:
                 self.driver.quit()
-            if self.session and not self.session.closed:
+            if self._owns_session and self.session and not self.session.closed:
                 await self.session.close()
         except Exception as e:
             logger.error(f"Cleanup failed: {str(e)}")
 
     # ========== HELPER METHODS ========== #
-    def _build_linkedin_url(self, job_title: str, location: str, lang_config: dict) -> str:
-        """Construct optimized LinkedIn search URL"""
-        base_url = f"https://{lang_config.get('linkedin_domain', 'www.linkedin.com')}/search/results/people/"
-        params = {
-            "keywords": f"{job_title} {location}",
-            "origin": "GLOBAL_SEARCH_HEADER",
-            "sid": "2*B"  # Magic string that helps avoid detection
-        }
-        return f"{base_url}?{'&'.join(f'{k}={quote_plus(v)}' for k, v in params.items())}"
-
-    async def _enforce_rate_limit(self) -> None:
-        """Smart rate limiting with exponential backoff"""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        min_delay = 60 / self.RATE_LIMIT
-        
-        if elapsed < min_delay:
-            backoff = min_delay - elapsed + random.uniform(0.5, 1.5)
-            await asyncio.sleep(backoff)
-            
-        self.last_request_time = time.time()
+    # Constant params pre-encoded once; only the keywords vary per query.
+    # sid=2*B is a magic string that helps avoid detection.
+    _URL_TAIL = "&origin=GLOBAL_SEARCH_HEADER&sid=2%2AB"
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_linkedin_url(job_title: str, location: str,
+                            linkedin_domain: str = "www.linkedin.com") -> str:
+        """Construct optimized LinkedIn search URL (memoized per query tuple)"""
+        return (
+            f"https://{linkedin_domain}/search/results/people/"
+            f"?keywords={quote_plus(f'{job_title} {location}')}"
+            f"{LinkedInScraper._URL_TAIL}"
+        )
 
     async def _check_for_blocking(self) -> bool:
         """Comprehensive blocking detection"""
         if not self.driver:
             return False
-        
-        blocking_indicators = [
-            "security check", "captcha", "verification",
-            "too many requests", "restricted", "blocked"
-        ]
-        
-        page_source = self.driver.page_source.lower()
-        return any(indicator in page_source for indicator in blocking_indicators)
+
+        # driver.page_source serializes the whole DOM over the WebDriver
+        # wire protocol; visible text via CDP is a fraction of the size
+        try:
+            resp = await _in_selenium_pool(
+                self.driver.execute_cdp_cmd, "Runtime.evaluate", {
+                    "expression": "document.body.innerText.toLowerCase()",
+                    "returnByValue": True,
+                })
+            text = resp["result"]["value"]
+        except Exception:
+            text = (await _in_selenium_pool(lambda: self.driver.page_source)).lower()
+
+        return _contains_blocking_indicator(text)
 
     async def _human_like_delay(self, min_sec: float = 1.5, max_sec: float = 4.5) -> None:
         """Randomized human-like delay with normal distribution"""
@@ -952,54 +1507,70 @@ class LinkedInScraper(Scraper):
         await asyncio.sleep(delay)
 
     async def _type_like_human(self, element, text: str) -> None:
-        """Simulate human typing behavior"""
-        for char in text:
-            element.send_keys(char)
-            await asyncio.sleep(random.uniform(0.05, 0.3))
-            
-        # Random chance of backspacing
-        if random.random() < 0.3:
-            for _ in range(random.randint(1, 3)):
-                element.send_keys(Keys.BACK_SPACE)
-                await asyncio.sleep(random.uniform(0.1, 0.5))
-                element.send_keys(text[-1])
-                await asyncio.sleep(random.uniform(0.1, 0.3))
+        """Simulate human typing behavior
+
+        One send_keys call instead of one WebDriver round trip per
+        character; the human-speed pause is a single sleep drawn from
+        the sum of the old per-character delay distribution.
+        """
+        await _in_selenium_pool(element.send_keys, text)
+        pause = max(0.0, random.normalvariate(len(text) * 0.15, len(text) * 0.05))
+        await asyncio.sleep(pause)
 
     async def _move_mouse_to_element(self, element) -> None:
         """Simulate human-like mouse movement"""
         if not self.driver:
             return
             
-        action = ActionChains(self.driver)
         try:
             # Move to element with slight offset
-            action.move_to_element_with_offset(
-                element, 
-                random.randint(-5, 5),
-                random.randint(-5, 5)
-            ).perform()
+            await _in_selenium_pool(
+                ActionChains(self.driver).move_to_element_with_offset(
+                    element,
+                    random.randint(-5, 5),
+                    random.randint(-5, 5)
+                ).perform
+            )
             await asyncio.sleep(random.uniform(0.2, 0.8))
         except:
             pass
 
     async def _simulate_scrolling(self) -> None:
-        """Simulate natural scrolling behavior"""
+        """Simulate natural scrolling behavior
+
+        The whole scroll schedule runs as one execute_async_script call
+        with browser-side setTimeout pacing, instead of one WebDriver
+        round trip (plus a Python sleep) per scroll step.
+        """
         if not self.driver:
             return
-            
+
         try:
-            scroll_pause = random.uniform(0.5, 1.5)
+            scroll_pause_ms = int(random.uniform(0.5, 1.5) * 1000)
             scroll_amount = random.randint(200, 800)
-            
-            for _ in range(random.randint(2, 5)):
-                self.driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
-                await asyncio.sleep(scroll_pause)
-                
-            # Sometimes scroll back up a bit
-            if random.random() < 0.4:
-                self.driver.execute_script(f"window.scrollBy(0, -{scroll_amount//2})")
-                await asyncio.sleep(scroll_pause)
-                
+            n_scrolls = random.randint(2, 5)
+            scroll_back = random.random() < 0.4
+
+            await _in_selenium_pool(
+                self.driver.execute_async_script,
+                """
+                const [n, amount, pause, back, done] = arguments;
+                let i = 0;
+                (function step() {
+                    if (i++ < n) {
+                        window.scrollBy(0, amount);
+                        setTimeout(step, pause);
+                    } else if (back) {
+                        window.scrollBy(0, -Math.floor(amount / 2));
+                        setTimeout(done, pause);
+                    } else {
+                        done();
+                    }
+                })();
+                """,
+                n_scrolls, scroll_amount, scroll_pause_ms, scroll_back
+            )
+
         except Exception as e:
             logger.debug(f"Scrolling simulation failed: {str(e)}")
 
@@ -1008,59 +1579,51 @@ class LinkedInScraper(Scraper):
         score = 0.5  # Base score
         
         # Name completeness
-        name_parts = name.split()
-        if len(name_parts) >= 2:
+        if len(name.split()) >= 2:
             score += 0.2
-            
-        # Title indicators
-        title_lower = title.lower()
-        if any(word in title_lower for word in ["manager", "director", "vp", "ceo"]):
+
+        # Title indicators: tokenize once, then two O(1) set intersections.
+        # Split on non-word characters so "VP, Engineering" and
+        # "CTO/Co-founder" still yield bare seniority tokens
+        tokens = set(_NON_WORD_RE.split(title.lower()))
+        if tokens & _SENIOR_HIGH:
             score += 0.2
-        elif any(word in title_lower for word in ["founder", "owner", "principal"]):
+        elif tokens & _SENIOR_MID:
             score += 0.15
-            
+
         return min(1.0, max(0.0, score))  # Clamp between 0-1
 
     def _get_realistic_user_agent(self) -> str:
         """Get realistic user agent with device diversity"""
-        user_agents = [
-            # Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
-            
-            # macOS
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
-            
-            # Linux
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            
-            # Mobile
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 14; SM-S928U) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Mobile Safari/537.36"
-        ]
-        return random.choice(user_agents)
+        return random.choice(_USER_AGENTS)
 # ========== ENHANCED LEAD ENRICHMENT ========== #
 class LeadEnricher:
     """Enhanced lead enrichment with more data sources"""
-    def __init__(self, progress: ProgressTracker, api_keys: dict):
+
+    # Candidate address builders as plain callables: f-strings skip the
+    # string.Formatter tokenization that pattern.format() pays per lead
+    EMAIL_BUILDERS = [
+        lambda first, last, domain: f"{first}.{last}@{domain}",
+        lambda first, last, domain: f"{first[0]}{last}@{domain}",
+        lambda first, last, domain: f"{first}{last[0]}@{domain}",
+        lambda first, last, domain: f"{first}_{last}@{domain}",
+        lambda first, last, domain: f"{first}@{domain}",
+    ]
+
+    def __init__(self, progress: ProgressTracker, api_keys: dict,
+                 session: aiohttp.ClientSession = None):
         self.progress = progress
         self.api_keys = api_keys
-        self.email_patterns = [
-            "{first}.{last}@{domain}",
-            "{f}{last}@{domain}",
-            "{first}{last[0]}@{domain}",
-            "{first}_{last}@{domain}",
-            "{first[0]}{last}@{domain}",
-            "{first}@{domain}",
-        ]
-        self._session = None  # For reusing aiohttp session
+        self._session = session  # Shared aiohttp session when injected
+        self._owns_session = session is None
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession()
+        if self._session is None:
+            self._session = _pooled_session()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self._session:
+        if self._owns_session and self._session:
             await self._session.close()
 
     async def enrich(self, lead: Dict[str, Any]) -> Dict[str, Any]:
@@ -1108,30 +1671,39 @@ class LeadEnricher:
 
     async def _find_emails(self, lead: Dict[str, Any]) -> List[str]:
         """Find emails using multiple methods"""
-        emails = set()
-        
+        candidates = []
+
         # Hunter.io API if available
         if "hunter.io" in self.api_keys:
             try:
-                hunter_emails = await self._query_hunter_api(lead)
-                emails.update(hunter_emails)
+                candidates.extend(await self._query_hunter_api(lead))
             except Exception as e:
                 logger.warning(f"Hunter.io API failed: {str(e)}")
 
         # Email pattern guessing as fallback
         if lead.get("name") and lead.get("company"):
-            guessed = self._guess_emails(lead)
-            emails.update(email.lower() for email in guessed if self._validate_email_format(email))
+            candidates.extend(self._guess_emails(lead))
+
+        # Validate the whole batch in one regex pass rather than one
+        # fullmatch call per candidate
+        joined = "\n".join(email.lower() for email in candidates)
+        emails = _dedupe_email_pool(_EMAIL_RE_MULTI.findall(joined))
+
+        return await self._verify_emails(emails)
 
     # Email verification if enabled
     async def _verify_emails(self, emails: Set[str]) -> List[str]:
         """Verify and filter emails"""
         if Config.VALIDATE_EMAILS and emails:
-            verified = set()
-            for email in emails:
-                if await self._verify_email(email):
-                    verified.add(email)
-            return sorted(verified)
+            sem = asyncio.Semaphore(10)
+
+            async def _bounded(email: str) -> Optional[str]:
+                async with sem:
+                    return email if await self._verify_email(email) else None
+
+            # Bounded fan-out: up to 10 verification calls in flight at once
+            verified = await asyncio.gather(*map(_bounded, emails))
+            return sorted(email for email in verified if email)
         return sorted(emails)
 
     def _guess_emails(self, lead: Dict[str, Any]) -> List[str]:
@@ -1150,21 +1722,10 @@ class LeadEnricher:
             if not domain:
                 return []
 
-            emails = []
-            for pattern in self.email_patterns:
-                try:
-                    email = pattern.format(
-                        first=first,
-                        f=first[0],
-                        last=last,
-                        domain=domain
-                    )
-                    if self._validate_email_format(email):
-                        emails.append(email)
-                except (KeyError, IndexError, AttributeError):
-                    continue
-            
-            return emails
+            return [
+                email for build in self.EMAIL_BUILDERS
+                if self._validate_email_format(email := build(first, last, domain))
+            ]
         except Exception as e:
             logger.debug(f"Email guessing failed: {str(e)}", exc_info=True)
             return []
@@ -1173,12 +1734,12 @@ class LeadEnricher:
         """More robust email validation"""
         if not email or not isinstance(email, str):
             return False
-        return bool(re.fullmatch(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$", email))
+        return bool(_EMAIL_RE.fullmatch(email))
 
     async def _query_hunter_api(self, lead: Dict[str, Any]) -> List[str]:
         """Query Hunter.io API for emails"""
         if not self._session:
-            self._session = aiohttp.ClientSession()
+            self._session = _pooled_session()
             
         domain = self._extract_domain(lead.get("company", ""))
         if not domain:
@@ -1189,7 +1750,7 @@ class LeadEnricher:
         try:
             async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _read_json(response)
                     return [e['value'] for e in data.get('data', {}).get('emails', [])]
                 logger.warning(f"Hunter API returned status {response.status}")
                 return []
@@ -1197,16 +1758,14 @@ class LeadEnricher:
             logger.warning(f"Hunter.io API request failed: {str(e)}")
             return []
 
-    def _extract_domain(self, company: str) -> str:
-        """Extract domain from company name"""
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_domain(company: str) -> str:
+        """Extract domain from company name (memoized per company string)"""
         if not company or not isinstance(company, str):
             return ""
         # Basic cleanup - should be enhanced with actual domain parsing
-        return f"{re.sub(r'[^a-zA-Z0-9]', '', company.lower())}.com"
-            
-        # Simple domain extraction - should be enhanced with actual domain lookup
-        company_clean = re.sub(r"[^\w]", "", company.lower())
-        return f"{company_clean}.com"
+        return f"{_NON_ALNUM_RE.sub('', company.lower())}.com"
 
     # Other methods should be implemented or raise NotImplementedError
     def _extract_basic_info(self, lead: Dict[str, Any]) -> Dict[str, Any]:
@@ -1230,22 +1789,21 @@ class LeadEnricher:
     
 # ========== BAIDU SCRAPER ========== #
 class BaiduScraper(Scraper):
-    def __init__(self, progress: ProgressTracker, lang_config: dict = None, 
-                 proxy_manager: ProxyManager = None):
-        super().__init__(progress)
+    def __init__(self, progress: ProgressTracker, lang_config: dict = None,
+                 proxy_manager: ProxyManager = None,
+                 session: aiohttp.ClientSession = None):
+        super().__init__(progress, session)
         self.lang_config = lang_config or {"code": "zh", "titles": {}}
         self.proxy_manager = proxy_manager
         self.driver = None
-        self.session = None
         self.retry_count = 0
-        self._request_delay = Config.DELAY_RANGE  # Use configured delay range
 
     async def cleanup(self):
         """Clean up resources"""
         try:
             if self.driver:
                 self.driver.quit()
-            if self.session and not self.session.closed:
+            if self._owns_session and self.session and not self.session.closed:
                 await self.session.close()
         except Exception as e:
             logger.error(f"Cleanup failed: {str(e)}")
@@ -1258,8 +1816,8 @@ class BaiduScraper(Scraper):
         results = []
         
         try:
-            await self._random_delay()  # Add random delay between requests
-            
+            await BUCKETS["baidu.com"].acquire()
+
             search_query = (
                 f'site:linkedin.com/in/ intitle:"{quote_plus(query["job_title"])}" '
                 f'"{quote_plus(query["industry"])}" "{quote_plus(query["location"])}"'
@@ -1269,18 +1827,21 @@ class BaiduScraper(Scraper):
             if not self.driver:
                 await self._init_browser()
             
-            try:
+            def _navigate() -> str:
                 self.driver.get(url)
                 WebDriverWait(self.driver, Config.REQUEST_TIMEOUT).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".result.c-container"))
                 )
-                
+                return self.driver.page_source
+
+            try:
+                html = await _in_selenium_pool(_navigate)
+
                 # Additional check for CAPTCHA
-                if self._check_for_captcha():
+                if await _in_selenium_pool(self._check_for_captcha):
                     raise Exception("CAPTCHA detected")
-                
-                soup = BeautifulSoup(self.driver.page_source, "html.parser")
-                results = self._parse_results(soup)
+
+                results = self._parse_results(html)
                 return results
                 
             except TimeoutException:
@@ -1299,27 +1860,28 @@ class BaiduScraper(Scraper):
         finally:
             self.progress.complete_task(f"Baidu ({query['location']})")
 
-    def _build_baidu_url(self, query: str) -> str:
-        """Construct Baidu search URL with proper parameters"""
-        return (
-            f"https://www.baidu.com/s?"
-            f"wd={query}&"
-            f"rn={Config.MAX_RESULTS}&"
-            f"ie=utf-8&"
-            f"oe=utf-8&"
-            f"cl=3&"
-            f"tn=baidutop10"
-        )
+    # Fixed params assembled once at class definition; only wd varies
+    _URL_TAIL = f"&rn={Config.MAX_RESULTS}&ie=utf-8&oe=utf-8&cl=3&tn=baidutop10"
 
-    def _parse_results(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _build_baidu_url(query: str) -> str:
+        """Construct Baidu search URL with proper parameters (memoized)"""
+        return f"https://www.baidu.com/s?wd={query}{BaiduScraper._URL_TAIL}"
+
+    def _parse_results(self, html: str) -> List[Dict[str, Any]]:
         """Parse Baidu search results for LinkedIn profiles"""
         results = []
-        for result in soup.select(".result.c-container"):
+        for result in LexborHTMLParser(html).css(".result.c-container"):
             try:
-                title = result.select_one("h3 a").text.strip()
-                url = result.select_one("h3 a")["href"]
-                snippet = result.select_one(".c-abstract").text.strip() if result.select_one(".c-abstract") else ""
-                
+                link = result.css_first("h3 a")
+                if link is None:
+                    continue
+                title = link.text(strip=True)
+                url = link.attributes.get("href", "")
+                snippet_node = result.css_first(".c-abstract")
+                snippet = snippet_node.text(strip=True) if snippet_node else ""
+
                 # Only include LinkedIn profiles
                 if "linkedin.com/in/" in url:
                     results.append({
@@ -1335,15 +1897,16 @@ class BaiduScraper(Scraper):
 
     async def _init_browser(self):
         """Initialize browser with Baidu-specific settings"""
+        _import_selenium()
         chrome_options = Options()
-        
+
+        for arg in _CHROME_BASE_ARGS:
+            chrome_options.add_argument(arg)
+
         # Baidu-specific settings
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument(f"user-agent={self._get_baidu_user_agent()}")
         chrome_options.add_argument("--lang=zh-CN")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        
+
         # Headless mode
         if Config.HEADLESS:
             chrome_options.add_argument("--headless=new")
@@ -1351,14 +1914,14 @@ class BaiduScraper(Scraper):
         
         # Proxy configuration
         if Config.PROXY_ENABLED and self.proxy_manager:
-            proxy = await self.proxy_manager.get_next_proxy()
+            proxy = self.proxy_manager.get_next_proxy()
             if proxy:
                 chrome_options.add_argument(f"--proxy-server={proxy}")
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
+
             # Apply stealth settings
             stealth(
                 self.driver,
@@ -1394,11 +1957,6 @@ class BaiduScraper(Scraper):
         except:
             return False
 
-    async def _random_delay(self):
-        """Add random delay between requests"""
-        delay = random.uniform(*self._request_delay)
-        await asyncio.sleep(delay)
-    
     # ========== GOOGLE SCRAPER ========== #
 class GoogleScrapeError(Exception):
     """Custom exception for Google scraping errors"""
@@ -1411,7 +1969,8 @@ class GoogleScraper:
         progress: Any,
         api_key: str = None,
         lang_config: dict = None,
-        proxy_manager: Any = None
+        proxy_manager: Any = None,
+        session: aiohttp.ClientSession = None
     ):
         self.progress = progress
         self.api_key = api_key
@@ -1422,15 +1981,27 @@ class GoogleScraper:
             "country_code": "us"
         }
         self.proxy_manager = proxy_manager
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         self.driver = None
         self.retry_count = 0
-        self.ua = UserAgent()
-        self.cache = {}
+        # Domain and language never change after init, so bake them into a
+        # template once; per-URL work is then quote_plus plus one format
+        self._url_tmpl = (
+            f"https://{self.lang_config.get('google_domain', 'google.com')}"
+            f"/search?q={{q}}&hl={self.lang_config['code']}&num=100"
+        )
+
+    @cached_property
+    def ua(self):
+        """fake-useragent database, loaded lazily on first use"""
+        from fake_useragent import UserAgent
+        return UserAgent()
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = _pooled_session()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -1438,62 +2009,59 @@ class GoogleScraper:
         await self.cleanup()
 
     async def cleanup(self):
-        """Clean up all resources"""
+        """Clean up all resources (shared sessions are left to their owner)"""
         try:
-            if self.session and not self.session.closed:
+            if self._owns_session and self.session and not self.session.closed:
                 await self.session.close()
             if self.driver:
                 self.driver.quit()
         except Exception as e:
             print(f"Cleanup error: {str(e)}")
 
-    async def _random_delay(self):
-        """Add random delay between requests with exponential backoff"""
-        base_delay = random.uniform(0.5, 2.5)
-        if self.retry_count > 0:
-            backoff_factor = min(2 ** self.retry_count, 30)
-            total_delay = base_delay * backoff_factor
-        else:
-            total_delay = base_delay
-        await asyncio.sleep(total_delay)
-
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type((aiohttp.ClientError, TimeoutError))
     )
     async def scrape(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Main scraping method with multiple fallback strategies"""
-        cache_key = f"{query['job_title']}_{query['location']}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
+        """Main scraping method with multiple fallback strategies
+
+        Repeat queries are served from the shared SERP HTML cache inside
+        the fetch strategies, so there is no per-instance result cache.
+        """
         results = []
         try:
             titles = [query['job_title']]  # Simplified for example
-            strategies = [self._scrape_via_api, self._scrape_direct, self._scrape_via_selenium]
+            sem = asyncio.Semaphore(5)
+
+            async def _scrape_title(title: str) -> List[Dict[str, Any]]:
+                """One title query: fall back through strategies sequentially"""
+                async with sem:
+                    # Retries draw extra tokens, which doubles as backoff
+                    await BUCKETS["google.com"].acquire(1 + self.retry_count)
+                    search_query = f"{title} {query['industry']} {query['location']}"
+                    url = self._build_google_url(search_query)
+
+                    for strategy in (self._scrape_via_api, self._scrape_direct,
+                                     self._scrape_via_selenium):
+                        try:
+                            if strategy == self._scrape_via_api and not self.api_key:
+                                continue
+                            page_results = await strategy(url)
+                            if page_results:
+                                return page_results
+                        except Exception as e:
+                            print(f"Strategy failed: {str(e)}")
+                            self.retry_count += 1
+                            continue
+                    return []
 
-            for title in titles:
-                await self._random_delay()
-                search_query = f"{title} {query['industry']} {query['location']}"
-                url = self._build_google_url(search_query)
+            # Fan out across titles: the pooled session overlaps the RTTs
+            for page_results in await asyncio.gather(*map(_scrape_title, titles)):
+                results.extend(page_results)
 
-                for strategy in strategies:
-                    try:
-                        if strategy == self._scrape_via_api and not self.api_key:
-                            continue
-                        page_results = await strategy(url)
-                        if page_results:
-                            results.extend(page_results)
-                            break
-                    except Exception as e:
-                        print(f"Strategy failed: {str(e)}")
-                        self.retry_count += 1
-                        continue
+            return self._deduplicate_results(results)
 
-            self.cache[cache_key] = self._deduplicate_results(results)
-            return self.cache[cache_key]
-        
         except Exception as e:
             print(f"Google scraping failed: {str(e)}")
             return []
@@ -1501,35 +2069,50 @@ class GoogleScraper:
             self.retry_count = 0
 
     async def _scrape_via_api(self, url: str) -> List[Dict[str, Any]]:
-        """Scrape using ScrapingBee API"""
+        """Scrape using ScrapingBee API, trying the cheap no-JS tier first
+
+        Google SERPs are usually server-rendered, so render_js=false
+        avoids the forced 5s rendering wait; the rendered tier only runs
+        when the cheap response parses zero rows.
+        """
+        cached = _serp_cache_get(url)
+        if cached is not None:
+            return self._parse_results(cached)
+
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = _pooled_session()
 
-        params = {
-            "api_key": self.api_key,
-            "url": url,
-            "render_js": "true",
-            "wait": "5000"
-        }
+        for tier in ({"render_js": "false", "wait": "0"},
+                     {"render_js": "true", "wait": "5000"}):
+            params = {"api_key": self.api_key, "url": url, **tier}
 
-        try:
-            async with self.session.get(
-                "https://app.scrapingbee.com/api/v1",
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                if resp.status != 200:
-                    error = await resp.text()
-                    raise GoogleScrapeError(f"API Error {resp.status}: {error}")
-                html = await resp.text()
-                return self._parse_results(BeautifulSoup(html, 'html.parser'))
-        except aiohttp.ClientError as e:
-            raise GoogleScrapeError(f"Network error: {str(e)}")
+            try:
+                async with self.session.get(
+                    "https://app.scrapingbee.com/api/v1",
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as resp:
+                    if resp.status != 200:
+                        error = await resp.text()
+                        raise GoogleScrapeError(f"API Error {resp.status}: {error}")
+                    html = await resp.text()
+                    results = self._parse_results(html)
+                    if results:
+                        _serp_cache_put(url, html)
+                        return results
+            except aiohttp.ClientError as e:
+                raise GoogleScrapeError(f"Network error: {str(e)}")
+
+        return []
 
     async def _scrape_direct(self, url: str) -> List[Dict[str, Any]]:
         """Direct scraping with headers"""
+        cached = _serp_cache_get(url)
+        if cached is not None:
+            return self._parse_results(cached)
+
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = _pooled_session()
 
         headers = self._get_headers()
         try:
@@ -1541,7 +2124,8 @@ class GoogleScraper:
                 if resp.status != 200:
                     raise GoogleScrapeError(f"HTTP Error {resp.status}")
                 html = await resp.text()
-                return self._parse_results(BeautifulSoup(html, 'html.parser'))
+                _serp_cache_put(url, html)
+                return self._parse_results(html)
         except aiohttp.ClientError as e:
             raise GoogleScrapeError(f"Direct request failed: {str(e)}")
 
@@ -1550,28 +2134,44 @@ class GoogleScraper:
         if not self.driver:
             await self._init_selenium()
 
-        try:
+        def _navigate() -> str:
             self.driver.get(url)
             WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".tF2Cxc, .g, .rc"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, self._CARDS_SEL))
             )
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            return self._parse_results(soup)
+            return self.driver.page_source
+
+        try:
+            html = await _in_selenium_pool(_navigate)
+            _serp_cache_put(url, html)
+            return self._parse_results(html)
         except Exception as e:
             raise GoogleScrapeError(f"Selenium failed: {str(e)}")
 
     async def _init_selenium(self):
         """Initialize Selenium browser"""
+        _import_selenium()
         chrome_options = ChromeOptions()
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+
+        for arg in _CHROME_BASE_ARGS:
+            chrome_options.add_argument(arg)
         chrome_options.add_argument(f"user-agent={self._get_user_agent()}")
-        
+
+        # SERP scraping only needs the rendered HTML: dropping images,
+        # stylesheets and fonts cuts a 1-2MB page to a few hundred KB
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.stylesheet": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+
         if True:  # Set your headless condition
             chrome_options.add_argument("--headless=new")
             chrome_options.add_argument("--window-size=1920,1080")
 
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             stealth(
                 self.driver,
@@ -1591,64 +2191,124 @@ class GoogleScraper:
             "Accept-Language": f"{self.lang_config['code']};q=0.9",
         }
 
+    @cached_property
+    def _ua_pool(self) -> Tuple[str, ...]:
+        """Agents pre-sampled once per scraper; sampling fake-useragent's
+        database on every request is needless work at high QPS"""
+        return tuple(self.ua.random for _ in range(64))
+
     def _get_user_agent(self) -> str:
         """Get random user agent"""
-        return self.ua.random
+        return random.choice(self._ua_pool)
 
     def _build_google_url(self, query: str) -> str:
-        """Build Google search URL"""
-        domain = self.lang_config.get("google_domain", "google.com")
-        return (
-            f"https://{domain}/search?"
-            f"q={quote_plus(query)}&"
-            f"hl={self.lang_config['code']}&"
-            f"num=100"
-        )
+        """Build Google search URL from the precomputed template"""
+        return self._url_tmpl.format(q=quote_plus(query))
 
-    def _parse_results(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    # Result-card and snippet selectors shared by the parse and wait paths
+    _CARDS_SEL = ".tF2Cxc, .g, .rc"
+    _SNIPPET_SEL = ".IsZvec, .st, .s"
+
+    def _parse_results(self, html: str) -> List[Dict[str, Any]]:
         """Parse search results"""
         results = []
-        for result in soup.select(".tF2Cxc, .g, .rc"):
+        ts = datetime.now().isoformat()  # One timestamp per parsed batch
+        nodes = LexborHTMLParser(html).css(self._CARDS_SEL)
+        if not nodes:
+            # lexbor occasionally drops Google's malformed cards; lxml's
+            # recovering parser plus XPath usually still finds them
+            return self._parse_results_lxml(html)
+
+        for result in nodes:
             try:
-                link = result.select_one("a")["href"]
-                title = result.select_one("h3").text.strip()
-                snippet = result.select_one(".IsZvec, .st, .s")
+                link_node = result.css_first("a")
+                title_node = result.css_first("h3")
+                if link_node is None or title_node is None:
+                    continue
+                snippet = result.css_first(self._SNIPPET_SEL)
                 results.append({
-                    "title": title,
-                    "url": self._clean_url(link),
-                    "snippet": snippet.text.strip() if snippet else "",
+                    "title": title_node.text(strip=True),
+                    "url": self._clean_url(link_node.attributes.get("href", "")),
+                    "snippet": snippet.text(strip=True) if snippet else "",
                     "source": "Google",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": ts
                 })
             except Exception as e:
                 continue
         return results
 
-    def _clean_url(self, url: str) -> str:
-        """Clean tracking parameters from URL"""
+    # XPath expressions compiled once to libxml2 form; evaluation is then
+    # a pure C traversal with no per-call parse of the expression text.
+    # Class tests pad @class with spaces for whole-token matching, since
+    # contains() alone would treat 'g' or 's' as a substring of any class
+    _CARDS_XPATH = etree.XPath(
+        "//div[contains(concat(' ', normalize-space(@class), ' '), ' tF2Cxc ') "
+        "or contains(concat(' ', normalize-space(@class), ' '), ' g ') "
+        "or contains(concat(' ', normalize-space(@class), ' '), ' rc ')]"
+    )
+    _HREF_XPATH = etree.XPath("(.//a/@href)[1]")
+    _TITLE_XPATH = etree.XPath("string(.//h3)")
+    _SNIPPET_XPATH = etree.XPath(
+        "string(.//*[contains(concat(' ', normalize-space(@class), ' '), ' IsZvec ') "
+        "or contains(concat(' ', normalize-space(@class), ' '), ' st ') "
+        "or contains(concat(' ', normalize-space(@class), ' '), ' s ')])"
+    )
+
+    def _parse_results_lxml(self, html: str) -> List[Dict[str, Any]]:
+        """XPath fallback over an lxml.html tree; traversal stays in C"""
+        results = []
+        ts = datetime.now().isoformat()  # One timestamp per parsed batch
+        try:
+            tree = lxml_html.fromstring(html)
+        except etree.ParserError:
+            return results
+
+        for result in self._CARDS_XPATH(tree):
+            try:
+                hrefs = self._HREF_XPATH(result)
+                title = self._TITLE_XPATH(result).strip()
+                if not hrefs or not title:
+                    continue
+                results.append({
+                    "title": title,
+                    "url": self._clean_url(hrefs[0]),
+                    "snippet": self._SNIPPET_XPATH(result).strip(),
+                    "source": "Google",
+                    "timestamp": ts
+                })
+            except Exception:
+                continue
+        return results
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_url(url: str) -> str:
+        """Clean tracking parameters from URL (memoized per raw URL)"""
         if url.startswith("/url?q="):
             url = url[7:].split('&')[0]
         return url.split('&')[0].split('?')[0]
 
     def _deduplicate_results(self, results: List[Dict]) -> List[Dict]:
-        """Remove duplicate results"""
-        seen = set()
-        unique = []
-        for result in results:
-            key = (result["url"], result["title"])
-            if key not in seen:
-                seen.add(key)
-                unique.append(result)
-        return unique
+        """Remove duplicate results by profile URL"""
+        # Dict insertion order does the bookkeeping: one O(N) hashing pass,
+        # keyed case-insensitively on the URL without its query string
+        return list({
+            _url_fingerprint(r["url"].lower().split("?")[0]): r for r in results
+        }.values())
         
 # ========== LEAD ENRICHMENT ========== #
 class LeadEnricher:
-    def __init__(self, progress: ProgressTracker, api_keys: dict):
+    def __init__(self, progress: ProgressTracker, api_keys: dict,
+                 session: aiohttp.ClientSession = None):
         self.progress = progress
         self.api_keys = api_keys
+        self.session = session  # Shared aiohttp session when injected
 
     async def enrich(self, lead: Dict) -> Dict:
         """Enhance lead data with additional info"""
+        # Guarantee the sort key _process_results relies on; scrapers
+        # emit quality_score (or nothing), never score
+        lead.setdefault("score", 0)
         if not Config.AI_ENRICHMENT:
             return lead
 
@@ -1684,46 +2344,101 @@ class LeadEnricher:
             if not domain:
                 return []
 
-            patterns = [
-                f"{first}.{last}@{domain}",       # john.doe@company.com
-                f"{first[0]}{last}@{domain}",     # jdoe@company.com
-                f"{first}@{domain}",              # john@company.com
-                f"{first}_{last}@{domain}",       # john_doe@company.com
-                f"{first[0]}.{last}@{domain}",    # j.doe@company.com
+            return [
+                email for email in self._email_patterns(first, last, domain)
+                if self._validate_email(email)
             ]
-            
-            return [email for email in patterns if self._validate_email(email)]
         except Exception as e:
             logger.debug(f"Email guessing failed: {str(e)}")
             return []
 
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _email_patterns(first: str, last: str, domain: str) -> Tuple[str, ...]:
+        """Candidate addresses for a (first, last, domain) triple, memoized
+        so repeat names across leads skip the string building"""
+        return (
+            f"{first}.{last}@{domain}",       # john.doe@company.com
+            f"{first[0]}{last}@{domain}",     # jdoe@company.com
+            f"{first}@{domain}",              # john@company.com
+            f"{first}_{last}@{domain}",       # john_doe@company.com
+            f"{first[0]}.{last}@{domain}",    # j.doe@company.com
+        )
+
+    def _validate_email(self, email: str) -> bool:
+        """Check a candidate against the module-level email pattern"""
+        return bool(_EMAIL_RE.fullmatch(email))
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_domain(company: str) -> str:
+        """Extract domain from company name (memoized per company string)"""
+        if not company or not isinstance(company, str):
+            return ""
+        # Basic cleanup - should be enhanced with actual domain parsing
+        return f"{_NON_ALNUM_RE.sub('', company.lower())}.com"
+
     async def _find_company(self, lead: Dict) -> str:
         """Find company using Hunter.io"""
         if "hunter.io" not in self.api_keys:
             return ""
-        
+
+        if self.session is None:
+            self.session = _pooled_session()
+
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://api.hunter.io/v2/domain-search?domain={lead['url'].split('/in/')[1].split('/')[0]}&api_key={self.api_keys['hunter.io']}"
-                async with session.get(url) as resp:
-                    data = await resp.json()
-                    return data.get('data', {}).get('organization', '')
+            url = f"https://api.hunter.io/v2/domain-search?domain={lead['url'].split('/in/')[1].split('/')[0]}&api_key={self.api_keys['hunter.io']}"
+            async with self.session.get(url) as resp:
+                data = await _read_json(resp)
+                return data.get('data', {}).get('organization', '')
         except:
             return ""
             
        # ========== MAIN GENERATOR ========== #
 class LeadGeneratorX:
-    def __init__(self, api_keys: dict = None, lang_config: dict = None, 
+    # Enrichment queue tuning: each worker drains leads in slabs of this
+    # size, so worker x batch bounds the concurrent enrichment calls
+    ENRICH_BATCH = 25
+    ENRICH_WORKERS = 4
+
+    def __init__(self, api_keys: dict = None, lang_config: dict = None,
                  progress: ProgressTracker = None, proxy_manager: ProxyManager = None):
         self.progress = progress or ProgressTracker()
         self.api_keys = api_keys or {}
         self.lang_config = lang_config or PolyglotScraper.LANGUAGE_MAP["English"]
-        self._cache = {}  # For caching API responses
+        self._cache = {}  # L1: in-process API response cache
         self._last_calls = {}  # For rate limiting
-        self.ua = UserAgent()  # For realistic headers
+        self._rate_info = {}  # Per-service (remaining, reset) from headers
+        # L2: shared across workers and runs when REDIS_URL is set, so
+        # repeat queries skip paid API calls entirely
+        redis_url = os.environ.get("REDIS_URL")
+        self._redis = (aioredis.from_url(redis_url)
+                       if aioredis is not None and redis_url else None)
         self.proxy_manager = proxy_manager  # Store it
         self.enricher = LeadEnricher(self.progress, self.api_keys)
         self.scrapers = []
+        self._session = None  # Shared aiohttp session for all scrapers
+
+    @cached_property
+    def ua(self):
+        """fake-useragent database (for realistic headers), loaded lazily"""
+        from fake_useragent import UserAgent
+        return UserAgent()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily build the orchestrator session on the shared pool"""
+        if self._session is None or self._session.closed:
+            self._session = _pooled_session()
+        return self._session
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self.cleanup()
 
     async def scrape_earthwide(self, job_title: str, industry: str, location: str) -> List[Dict]:
         """Orchestrate global scraping"""
@@ -1734,16 +2449,25 @@ class LeadGeneratorX:
             if not regions:  # Global search
                 all_leads = await self._scrape_region(job_title, industry, location)
             else:
-                for country in regions:
+                # Regions are independent, so total latency should track the
+                # slowest one; the semaphore keeps the combined scraper
+                # fan-out from opening too many connections at once
+                sem = asyncio.Semaphore(8)
+
+                async def _one_region(country: str) -> List[Dict]:
                     task_name = f"Scraping {country}"
                     self.progress.add_task(task_name)
-                    leads = await self._scrape_region(
-                        job_title,
-                        industry,
-                        f"{location}, {country}" if "," in location else country
-                    )
-                    all_leads.extend(leads)
+                    async with sem:
+                        leads = await self._scrape_region(
+                            job_title,
+                            industry,
+                            f"{location}, {country}" if "," in location else country
+                        )
                     self.progress.update(task_name, advance=100)
+                    return leads
+
+                region_results = await asyncio.gather(*map(_one_region, regions))
+                all_leads = [lead for sub in region_results for lead in sub]
 
         return await self._process_results(all_leads)
 
@@ -1755,22 +2479,27 @@ class LeadGeneratorX:
             "hl": self.lang_config["code"]
         }
         
-        # Pass proxy_manager to scrapers that need it
+        session = await self._get_session()
+
+        # Pass proxy_manager and the shared session to scrapers that need them
         linkedin = LinkedInScraper(
-            self.progress, 
-            self.api_keys.get("ScrapingBee"), 
+            self.progress,
+            self.api_keys.get("ScrapingBee"),
             self.lang_config,
-            self.proxy_manager  # Pass it here
+            self.proxy_manager,  # Pass it here
+            session
         )
         google = GoogleScraper(
-            self.progress, 
-            self.api_keys.get("ScrapingBee"), 
-            self.lang_config
+            self.progress,
+            self.api_keys.get("ScrapingBee"),
+            self.lang_config,
+            session=session
         )
         baidu = BaiduScraper(
-            self.progress, 
+            self.progress,
             self.lang_config,
-            self.proxy_manager  # And here if Baidu needs proxies
+            self.proxy_manager,  # And here if Baidu needs proxies
+            session
         )
         
         # Run concurrently (add Baidu to the gather)
@@ -1787,15 +2516,43 @@ class LeadGeneratorX:
 
     async def _process_results(self, results: List[Dict]) -> List[Dict]:
         """Deduplicate and enrich leads"""
-        seen = set()
-        enriched = []
-        
-        for lead in results:
-            if lead["url"] not in seen:
-                seen.add(lead["url"])
-                enriched.append(await self.enricher.enrich(lead))
-        
-        return sorted(enriched, key=lambda x: x.get("score", 0), reverse=True)
+        # Enrichment API calls ride on the shared connection pool
+        self.enricher.session = await self._get_session()
+
+        # Single C-level hashing pass; dict insertion order keeps the
+        # pure-CPU dedup separate from the awaitable enrichment below
+        unique = list({
+            _url_fingerprint(lead["url"]): lead for lead in results
+        }.values())
+
+        # Batch enrichment: workers drain the queue in slabs of ENRICH_BATCH
+        # and enrich each slab concurrently over the shared session, so
+        # wall-clock tracks the slowest API call per slab instead of
+        # leads x latency, while worker count bounds in-flight requests
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(unique):
+            queue.put_nowait(item)
+        enriched: List[Optional[Dict]] = [None] * len(unique)
+
+        async def _worker():
+            while True:
+                batch = []
+                try:
+                    while len(batch) < self.ENRICH_BATCH:
+                        batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    pass
+                if not batch:
+                    return
+                slab = await asyncio.gather(
+                    *(self.enricher.enrich(lead) for _, lead in batch)
+                )
+                for (idx, _), lead in zip(batch, slab):
+                    enriched[idx] = lead
+
+        await asyncio.gather(*(_worker() for _ in range(self.ENRICH_WORKERS)))
+        enriched.sort(key=operator.itemgetter("score"), reverse=True)
+        return enriched
 
     def cleanup(self):
         """Release all resources"""
@@ -1803,28 +2560,55 @@ class LeadGeneratorX:
             if hasattr(scraper, 'cleanup'):
                 scraper.cleanup()
                 
+    async def _cache_get(self, key: str) -> Optional[Any]:
+        """Check the L1 dict, then the optional Redis L2; None on miss"""
+        if key in self._cache:
+            return self._cache[key]
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+            except Exception as e:
+                logger.debug(f"Redis get failed: {str(e)}")
+                return None
+            if raw is not None:
+                value = _json_loads(raw)
+                self._cache[key] = value  # Promote to L1
+                return value
+        return None
+
+    async def _cache_set(self, key: str, value: Any, ttl: int = 86400) -> None:
+        """Store in L1 and, when configured, the Redis L2 with a TTL"""
+        self._cache[key] = value
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, _json_dumps_bytes(value), ex=ttl)
+            except Exception as e:
+                logger.debug(f"Redis set failed: {str(e)}")
+
     async def _verify_email(self, email: str) -> bool:
         """Verify email existence using MailboxLayer API"""
         if "mailboxlayer" not in self.api_keys:
             return True  # Skip verification if no API key
-            
+
         cache_key = f"email_verify_{email}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"http://apilayer.net/api/check?email={email}&access_key={self.api_keys['mailboxlayer']}"
-                async with session.get(url, timeout=10) as resp:
-                    if resp.status != 200:
-                        logger.warning(f"Email verification API error: HTTP {resp.status}")
-                        return True  # Assume valid if API fails
-                    
-                    data = await resp.json()
-                    is_valid = data.get('format_valid', False) and data.get('mx_found', False)
-                    self._cache[cache_key] = is_valid  # Cache the result
-                    return is_valid
-                    
+            session = await self._get_session()
+            url = f"http://apilayer.net/api/check?email={email}&access_key={self.api_keys['mailboxlayer']}"
+            async with session.get(url, timeout=10) as resp:
+                if resp.status != 200:
+                    logger.warning(f"Email verification API error: HTTP {resp.status}")
+                    return True  # Assume valid if API fails
+
+                data = await _read_json(resp)
+                is_valid = data.get('format_valid', False) and data.get('mx_found', False)
+                await self._cache_set(cache_key, is_valid)
+                return is_valid
+
+
         except asyncio.TimeoutError:
             logger.warning("Email verification timed out")
             return True  # Assume valid on timeout
@@ -1836,13 +2620,20 @@ class LeadGeneratorX:
         """Get full company data from Clearbit"""
         if "clearbit" not in self.api_keys:
             return {}
-            
+
+        cache_key = f"clearbit_{domain}"
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://company.clearbit.com/v2/companies/find?domain={domain}"
-                headers = {"Authorization": f"Bearer {self.api_keys['clearbit']}"}
-                async with session.get(url, headers=headers, timeout=10) as resp:
-                    return await resp.json()
+            session = await self._get_session()
+            url = f"https://company.clearbit.com/v2/companies/find?domain={domain}"
+            headers = {"Authorization": f"Bearer {self.api_keys['clearbit']}"}
+            async with session.get(url, headers=headers, timeout=10) as resp:
+                details = await _read_json(resp)
+                await self._cache_set(cache_key, details)
+                return details
         except Exception as e:
             logger.debug(f"Clearbit lookup failed: {str(e)}")
             return {}
@@ -1854,16 +2645,16 @@ class LeadGeneratorX:
             return profiles
             
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.fullcontact.com/v3/person.enrich"
-                headers = {"Authorization": f"Bearer {self.api_keys['fullcontact']}"}
-                data = {"fullName": name, "company": company}
-                
-                async with session.post(url, json=data, headers=headers) as resp:
-                    result = await resp.json()
-                    if "socialProfiles" in result:
-                        for profile in result["socialProfiles"]:
-                            profiles[profile["type"].lower()] = profile["url"]
+            session = await self._get_session()
+            url = "https://api.fullcontact.com/v3/person.enrich"
+            headers = {"Authorization": f"Bearer {self.api_keys['fullcontact']}"}
+            data = {"fullName": name, "company": company}
+
+            async with session.post(url, json=data, headers=headers) as resp:
+                result = await _read_json(resp)
+                if "socialProfiles" in result:
+                    for profile in result["socialProfiles"]:
+                        profiles[profile["type"].lower()] = profile["url"]
         except Exception:
             pass
             
@@ -1875,54 +2666,93 @@ class LeadGeneratorX:
             return True
             
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://lookups.twilio.com/v1/PhoneNumbers/{phone}"
-                auth = aiohttp.BasicAuth(self.api_keys["twilio_sid"], self.api_keys["twilio_token"])
-                async with session.get(url, auth=auth) as resp:
-                    return resp.status == 200
+            session = await self._get_session()
+            url = f"https://lookups.twilio.com/v1/PhoneNumbers/{phone}"
+            auth = aiohttp.BasicAuth(self.api_keys["twilio_sid"], self.api_keys["twilio_token"])
+            async with session.get(url, auth=auth) as resp:
+                return resp.status == 200
         except Exception:
             return False            
             
     def _normalize_data(self, lead: Dict) -> Dict:
-        """Standardize all field formats"""
-        normalized = lead.copy()
-        
+        """Standardize all field formats, mutating the lead in place
+
+        The sole caller passes the enriched copy it built itself, so
+        there is no need to copy the dict again before normalizing.
+        """
         # Name formatting
-        if "name" in normalized:
-            normalized["name"] = " ".join(
-                part.capitalize() for part in normalized["name"].split()
+        if "name" in lead:
+            lead["name"] = " ".join(
+                part.capitalize() for part in lead["name"].split()
             )
-        
+
         # Phone formatting
-        if "phones" in normalized:
-            normalized["phones"] = [
-                re.sub(r"[^\d+]", "", phone) 
-                for phone in normalized["phones"]
+        if "phones" in lead:
+            lead["phones"] = [
+                _PHONE_RE.sub("", phone)
+                for phone in lead["phones"]
             ]
-        
+
         # Email lowercase
-        if "email" in normalized:
-            normalized["email"] = normalized["email"].lower()
-            
-        return normalized     
+        if "email" in lead:
+            lead["email"] = lead["email"].lower()
+
+        return lead
         
+    def _note_rate_headers(self, service: str, resp) -> None:
+        """Record the provider's X-RateLimit headers for _rate_limit
+
+        Knowing the real remaining quota lets us skip the conservative
+        fixed delay while there is headroom and sleep exactly until the
+        window resets when there is not.
+        """
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        reset = resp.headers.get("X-RateLimit-Reset")
+        try:
+            self._rate_info[service] = (
+                int(remaining), float(reset) if reset else None
+            )
+        except ValueError:
+            pass
+
     async def _rate_limit(self, service: str):
-        """Enforce API rate limits"""
+        """Enforce API rate limits on the event loop's monotonic clock
+
+        Uses the provider's advertised quota when headers were seen;
+        otherwise falls back to the fixed per-service delay table.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        info = self._rate_info.get(service)
+        if info is not None:
+            remaining, reset_ts = info
+            if remaining > 1:
+                self._last_calls[service] = now
+                return
+            if reset_ts is not None:
+                # Reset is epoch wall time; sleep out the rest of the window
+                await asyncio.sleep(max(0.0, reset_ts - time.time()))
+                self._last_calls[service] = loop.time()
+                return
+
         if service not in self._last_calls:
-            self._last_calls[service] = datetime.now()
+            self._last_calls[service] = now
             return
-            
-        elapsed = (datetime.now() - self._last_calls[service]).total_seconds()
+
+        elapsed = now - self._last_calls[service]
         min_delay = {
             "hunter": 0.5,
             "clearbit": 1.0,
             "fullcontact": 2.0
         }.get(service, 1.0)
-        
+
         if elapsed < min_delay:
             await asyncio.sleep(min_delay - elapsed)
-        
-        self._last_calls[service] = datetime.now()    
+
+        self._last_calls[service] = loop.time()
         
     async def enrich(self, lead: Dict) -> Dict:
         """Full enrichment workflow"""
@@ -1946,13 +2776,28 @@ class LeadGeneratorX:
         enriched["score"] = self._calculate_score(enriched)
         return self._normalize_data(enriched)    
         
+    @retry(stop=stop_after_attempt(5),
+           wait=wait_exponential(multiplier=1, min=1, max=30),
+           retry=retry_if_exception_type(aiohttp.ClientError))
+    async def _api_get(self, url: str, service: str) -> Dict:
+        """One rate-limited GET; 429s honor Retry-After before retrying"""
+        await self._rate_limit(service)
+        session = await self._get_session()
+        async with session.get(url, timeout=10) as resp:
+            if resp.status == 429:
+                retry_after = resp.headers.get("Retry-After")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 5.0
+                await asyncio.sleep(delay)
+            self._note_rate_headers(service, resp)
+            resp.raise_for_status()
+            return await _read_json(resp)
+
     async def safe_api_call(self, url: str, service: str) -> Optional[Dict]:
         try:
-            await self._rate_limit(service)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as resp:
-                    resp.raise_for_status()
-                    return await resp.json()
+            return await self._api_get(url, service)
         except Exception as e:
             logger.warning(f"API call failed ({service}): {str(e)}")
             return None
@@ -1961,37 +2806,46 @@ class LeadGeneratorX:
 async def main():
     """Enhanced main function with better user onboarding"""
     try:
-        # Show welcome banner
-        console.print(Panel.fit(
-            "[bold blue]🌐 Sistine Chapel Lead Hunter v1.0 🌐[/]",
-            subtitle="[green]Author: Don Giddy[/green]"
-        ))
-        
-        # Explain what APIs do
-        console.print(Panel.fit(
-            "[bold]About API Keys:[/]\n"
-            "This tool works best with API services that help:\n"
-            "1. Bypass website blocks (ScrapingBee)\n"
-            "2. Find email addresses (Hunter.io)\n"
-            "3. Enrich company data (Clearbit)\n\n"
-            "[yellow]You can skip all APIs but results will be limited[/]",
-            border_style="blue"
-        ))
-        
+        # Onboarding panels are for humans at a terminal; when output is
+        # piped or running in CI, skip rich's markup parsing entirely.
+        # console is built with force_terminal=True, so ask the real fd
+        if sys.stdout.isatty():
+            # Show welcome banner
+            console.print(Panel.fit(
+                "[bold blue]🌐 Sistine Chapel Lead Hunter v1.0 🌐[/]",
+                subtitle="[green]Author: Don Giddy[/green]"
+            ))
+
+            # Explain what APIs do
+            console.print(Panel.fit(
+                "[bold]About API Keys:[/]\n"
+                "This tool works best with API services that help:\n"
+                "1. Bypass website blocks (ScrapingBee)\n"
+                "2. Find email addresses (Hunter.io)\n"
+                "3. Enrich company data (Clearbit)\n\n"
+                "[yellow]You can skip all APIs but results will be limited[/]",
+                border_style="blue"
+            ))
+        else:
+            logger.info("Sistine Chapel Lead Hunter v1.0 starting")
+
         # Configure APIs
         api_keys = await APIVault.configure()
-        
+
         # Explain what happens without APIs
         if not api_keys:
-            console.print(Panel.fit(
-                "[yellow]⚠ Warning[/]\n"
-                "Running without APIs means:\n"
-                "- Higher chance of being blocked\n"
-                "- No email addresses will be found\n"
-                "- Limited company information\n"
-                "- Fewer overall results",
-                border_style="yellow"
-            ))
+            if sys.stdout.isatty():
+                console.print(Panel.fit(
+                    "[yellow]⚠ Warning[/]\n"
+                    "Running without APIs means:\n"
+                    "- Higher chance of being blocked\n"
+                    "- No email addresses will be found\n"
+                    "- Limited company information\n"
+                    "- Fewer overall results",
+                    border_style="yellow"
+                ))
+            else:
+                logger.info("No API keys configured; running with limited functionality")
             confirm = await questionary.confirm(
                 "Continue with limited functionality?",
                 default=False
@@ -2019,14 +2873,21 @@ async def main():
                 progress=tracker,
                 proxy_manager=proxy_manager
             )
-            
-            results = await generator.scrape_earthwide(**params)
+
+            # The context manager closes the orchestrator's lazily created
+            # session; closing the shared connector alone does not
+            async with generator:
+                results = await generator.scrape_earthwide(**params)
             
             # Save results with user feedback
             if results:
                 json_file = Config.OUTPUT_FILE
-                with open(json_file, "w", encoding="utf-8") as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    with open(json_file, "wb") as f:
+                        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(json_file, "w", encoding="utf-8") as f:
+                        json.dump(results, f, indent=2, ensure_ascii=False)
                     
                 console.print(Panel.fit(
                     f"[green]✓ Success! Found {len(results)} leads[/]\n"
@@ -2061,6 +2922,10 @@ async def main():
     finally:
         if 'generator' in locals():
             generator.cleanup()
+            # Belt and braces for exits that bypassed __aexit__
+            if generator._session and not generator._session.closed:
+                await generator._session.close()
+        await _close_shared_connector()
         await asyncio.sleep(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""Regression test for the pull-parser path in LinkedInScraper.
+
+The streaming parser only runs on pages larger than
+_STREAM_PARSE_THRESHOLD, so the fixture pads the HTML past 1 MB to
+exercise the same branch _parse_html takes on big Selenium pages.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "SC_Scraperv1.0.0.py"
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location("sc_scraper", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    sc = _load_module()
+except ImportError as e:  # Optional scraping deps absent in this env
+    sc = None
+    _IMPORT_ERROR = e
+
+pytestmark = pytest.mark.skipif(
+    sc is None, reason=f"scraper dependencies missing: {_IMPORT_ERROR if sc is None else ''}"
+)
+
+
+def _make_card(i: int) -> str:
+    return (
+        '<li class="entity-result">'
+        '<span class="entity-result__title-text">'
+        f'<a href="https://www.linkedin.com/in/lead-{i}?trk=x">Lead Number{i}</a>'
+        "</span>"
+        f'<div class="entity-result__primary-subtitle">Director of Sales</div>'
+        f'<div class="entity-result__secondary-subtitle">Berlin, Germany</div>'
+        "</li>"
+    )
+
+
+def _make_fixture(n_cards: int) -> str:
+    padding = "<div>" + "x" * 512 + "</div>"
+    cards = "".join(_make_card(i) for i in range(n_cards))
+    html = (
+        "<html><body>"
+        + padding * 2200  # Pushes the page well past the 1 MB threshold
+        + f'<div class="search-results-container"><ul>{cards}</ul></div>'
+        + "</body></html>"
+    )
+    assert len(html) > sc.LinkedInScraper._STREAM_PARSE_THRESHOLD
+    return html
+
+
+def test_streaming_parse_large_page():
+    scraper = sc.LinkedInScraper(sc.ProgressTracker())
+    results = scraper._parse_html_streaming(_make_fixture(5))
+
+    assert len(results) == 5
+    first = results[0]
+    assert first["name"] == "Lead Number0"
+    assert first["title"] == "Director of Sales"
+    assert first["location"] == "Berlin, Germany"
+    assert first["url"] == "https://www.linkedin.com/in/lead-0"
+
+
+def test_streaming_parse_stops_at_max_results():
+    scraper = sc.LinkedInScraper(sc.ProgressTracker())
+    results = scraper._parse_html_streaming(
+        _make_fixture(sc.Config.MAX_RESULTS + 10)
+    )
+    assert len(results) == sc.Config.MAX_RESULTS